@@ -3,15 +3,28 @@ Course Scheduling System Integration
 Complete system for managing and scheduling courses with real-time updates
 """
 
+import itertools
 import json
-import uuid
+import logging
+import queue
+import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+except ImportError:  # optional, only speeds up JSON export
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Enums and Constants
@@ -40,26 +53,151 @@ class ResourceType(Enum):
     HYBRID = "hybrid"
 
 
+MINUTES_PER_DAY = 24 * 60
+
+# Enum member -> value lookups for the serialization paths
+_LEVEL_STR = {member: member.value for member in CourseLevel}
+_STATUS_STR = {member: member.value for member in ScheduleStatus}
+_RESOURCE_TYPE_STR = {member: member.value for member in ResourceType}
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
 
-@dataclass
+def _parse_hhmm(value: str) -> int:
+    """Convert an HH:MM string to minutes since midnight"""
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _format_hhmm(minutes: int) -> str:
+    """Convert minutes since midnight to an HH:MM string"""
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}"
+
+
+def _iso_from_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value like datetime.utcnow().isoformat()"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.utcfromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class TimeSlot:
     """Represents a time slot for scheduling"""
     day_of_week: int  # 0-6 (Monday-Sunday)
-    start_time: str  # HH:MM format
-    end_time: str    # HH:MM format
+    start_min: int  # minutes since midnight
+    end_min: int    # minutes since midnight
+    _mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if isinstance(self.start_min, str) or isinstance(self.end_min, str):
+            raise TypeError("TimeSlot bounds are minutes since midnight; "
+                            "use TimeSlot.from_hhmm() for HH:MM strings")
+        offset = self.day_of_week * MINUTES_PER_DAY + self.start_min
+        length = self.end_min - self.start_min
+        # A slot that ends before it starts covers no minutes
+        object.__setattr__(self, '_mask', ((1 << length) - 1) << offset if length > 0 else 0)
+    
+    @classmethod
+    def from_hhmm(cls, day_of_week: int, start_time: str, end_time: str) -> 'TimeSlot':
+        """Create a slot from HH:MM start and end times"""
+        return cls(day_of_week, _parse_hhmm(start_time), _parse_hhmm(end_time))
+    
+    @property
+    def mask(self) -> int:
+        """Bitmask of the minutes covered by this slot within the week"""
+        return self._mask
+    
+    def __str__(self):
+        return f"{self.day_of_week} {self.start_time}-{self.end_time}"
+    
+    @property
+    def start_time(self) -> str:
+        return _format_hhmm(self.start_min)
+    
+    @property
+    def end_time(self) -> str:
+        return _format_hhmm(self.end_min)
     
     def to_dict(self):
-        return asdict(self)
+        return {
+            'day_of_week': self.day_of_week,
+            'start_time': self.start_time,
+            'end_time': self.end_time
+        }
     
     @staticmethod
     def from_dict(data):
-        return TimeSlot(**data)
+        return TimeSlot.from_hhmm(
+            day_of_week=data['day_of_week'],
+            start_time=data['start_time'],
+            end_time=data['end_time']
+        )
+
+
+# Hourly slots from 8 AM to 6 PM, Monday to Friday. TimeSlot instances are
+# never mutated by the schedulers, so the same tuple is shared by every call.
+_DEFAULT_SLOTS: Tuple[TimeSlot, ...] = tuple(
+    TimeSlot(day, hour * 60, (hour + 1) * 60)
+    for day in range(5)
+    for hour in range(8, 18)
+)
+
+# The default grid keyed by each slot's first minute of the week, plus those
+# start bits OR'ed together, for the fixed-grid fast path in GreedyScheduler.
+_DEFAULT_SLOT_MINUTES = 60
+_DEFAULT_SLOT_BY_START: Dict[int, TimeSlot] = {
+    slot.day_of_week * MINUTES_PER_DAY + slot.start_min: slot for slot in _DEFAULT_SLOTS
+}
+_DEFAULT_SLOT_STARTS = sum(1 << start for start in _DEFAULT_SLOT_BY_START)
+
+
+def _run_starts(mask: int, length: int) -> int:
+    """Bits i of mask such that bits i .. i + length - 1 are all set"""
+    covered = 1
+    while covered < length:
+        step = min(covered, length - covered)
+        mask &= mask >> step
+        covered += step
+    return mask
+
 
+def _slots_mask(slots: Sequence[TimeSlot]) -> int:
+    """Combine the minute bitmasks of several time slots"""
+    mask = 0
+    for slot in slots:
+        mask |= slot.mask
+    return mask
 
-@dataclass
+
+class _SlotsMask:
+    """Minute bitmask of a slot list field, cached until the list is reassigned or resized
+    
+    In-place edits that keep the length, such as replacing a slot, are not
+    detected; reassign the list after them.
+    """
+    
+    def __init__(self, source: str):
+        self.source = source
+    
+    def __set_name__(self, owner, name):
+        # Instance slot holding (list, its length, mask)
+        self.cache = "_" + name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        slots = getattr(instance, self.source)
+        cached = getattr(instance, self.cache)
+        if cached is None or cached[0] is not slots or cached[1] != len(slots):
+            cached = (slots, len(slots), _slots_mask(slots))
+            setattr(instance, self.cache, cached)
+        return cached[2]
+
+
+@dataclass(slots=True)
 class Resource:
     """Physical or virtual resource required for a course"""
     resource_id: str
@@ -67,19 +205,28 @@ class Resource:
     resource_type: ResourceType
     capacity: int
     availability_hours: List[TimeSlot] = field(default_factory=list)
+    _avail_mask: Optional[Tuple[List[TimeSlot], int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Weekly availability as a minute bitmask
+    avail_mask = _SlotsMask("availability_hours")
     
     def to_dict(self):
-        data = asdict(self)
-        data['resource_type'] = self.resource_type.value
-        data['availability_hours'] = [ts.to_dict() for ts in self.availability_hours]
-        return data
+        return {
+            'resource_id': self.resource_id,
+            'name': self.name,
+            'resource_type': _RESOURCE_TYPE_STR[self.resource_type],
+            'capacity': self.capacity,
+            'availability_hours': [ts.to_dict() for ts in self.availability_hours]
+        }
     
     @staticmethod
     def from_dict(data):
         resource_type = ResourceType(data['resource_type'])
         availability_hours = [TimeSlot.from_dict(ts) for ts in data.get('availability_hours', [])]
         return Resource(
-            resource_id=data['resource_id'],
+            resource_id=sys.intern(data['resource_id']),
             name=data['name'],
             resource_type=resource_type,
             capacity=data['capacity'],
@@ -87,7 +234,7 @@ class Resource:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Instructor:
     """Course instructor information"""
     instructor_id: str
@@ -96,6 +243,12 @@ class Instructor:
     specialization: str
     available_slots: List[TimeSlot] = field(default_factory=list)
     max_students: int = 50
+    _avail_mask: Optional[Tuple[List[TimeSlot], int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Weekly availability as a minute bitmask
+    avail_mask = _SlotsMask("available_slots")
     
     def to_dict(self):
         return {
@@ -111,16 +264,16 @@ class Instructor:
     def from_dict(data):
         available_slots = [TimeSlot.from_dict(ts) for ts in data.get('available_slots', [])]
         return Instructor(
-            instructor_id=data['instructor_id'],
+            instructor_id=sys.intern(data['instructor_id']),
             name=data['name'],
             email=data['email'],
-            specialization=data['specialization'],
+            specialization=sys.intern(data['specialization']),
             available_slots=available_slots,
             max_students=data.get('max_students', 50)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Course:
     """Course information and metadata"""
     course_id: str
@@ -142,14 +295,32 @@ class Course:
             'course_id': self.course_id,
             'name': self.name,
             'description': self.description,
-            'level': self.level.value,
+            'level': _LEVEL_STR[self.level],
             'instructor': self.instructor.to_dict(),
             'duration_weeks': self.duration_weeks,
             'capacity': self.capacity,
             'required_resources': [r.to_dict() for r in self.required_resources],
             'prerequisites': self.prerequisites,
             'schedule': self.schedule.to_dict() if self.schedule else None,
-            'status': self.status.value,
+            'status': _STATUS_STR[self.status],
+            'enrolled_students': self.enrolled_students,
+            'created_at': self.created_at
+        }
+    
+    def to_record(self):
+        """Flat representation referencing instructor and resources by ID"""
+        return {
+            'course_id': self.course_id,
+            'name': self.name,
+            'description': self.description,
+            'level': _LEVEL_STR[self.level],
+            'instructor_id': self.instructor.instructor_id,
+            'duration_weeks': self.duration_weeks,
+            'capacity': self.capacity,
+            'required_resource_ids': [r.resource_id for r in self.required_resources],
+            'prerequisites': self.prerequisites,
+            'schedule': self.schedule.to_dict() if self.schedule else None,
+            'status': _STATUS_STR[self.status],
             'enrolled_students': self.enrolled_students,
             'created_at': self.created_at
         }
@@ -163,7 +334,7 @@ class Course:
         schedule = TimeSlot.from_dict(data['schedule']) if data.get('schedule') else None
         
         return Course(
-            course_id=data['course_id'],
+            course_id=sys.intern(data['course_id']),
             name=data['name'],
             description=data['description'],
             level=level,
@@ -171,7 +342,7 @@ class Course:
             duration_weeks=data['duration_weeks'],
             capacity=data['capacity'],
             required_resources=resources,
-            prerequisites=data.get('prerequisites', []),
+            prerequisites=[sys.intern(p) for p in data.get('prerequisites', [])],
             schedule=schedule,
             status=status,
             enrolled_students=data.get('enrolled_students', 0),
@@ -179,13 +350,26 @@ class Course:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScheduleConflict:
     """Represents a scheduling conflict"""
     course_id: str
     conflict_type: str
     description: str
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> str:
+        """Creation time as an ISO 8601 string, formatted on demand"""
+        return _iso_from_ns(self.timestamp_ns)
+    
+    def to_dict(self):
+        return {
+            'course_id': self.course_id,
+            'conflict_type': self.conflict_type,
+            'description': self.description,
+            'timestamp': self.timestamp
+        }
 
 
 # ============================================================================
@@ -196,7 +380,7 @@ class Scheduler(ABC):
     """Abstract base class for scheduling algorithms"""
     
     @abstractmethod
-    def schedule_course(self, course: Course, available_slots: List[TimeSlot]) -> Optional[TimeSlot]:
+    def schedule_course(self, course: Course, available_slots: Sequence[TimeSlot]) -> Optional[TimeSlot]:
         """Schedule a course in an available time slot"""
         pass
     
@@ -225,41 +409,36 @@ class GreedyScheduler(Scheduler):
     def __init__(self):
         self.scheduled_slots = {}
     
-    def schedule_course(self, course: Course, available_slots: List[TimeSlot]) -> Optional[TimeSlot]:
+    def schedule_course(self, course: Course, available_slots: Sequence[TimeSlot]) -> Optional[TimeSlot]:
         """Schedule course to first available slot"""
+        feasible = self._feasible_mask(course)
+        if not feasible:
+            return None
+        if available_slots is _DEFAULT_SLOTS:
+            slot = self._first_default_slot(feasible)
+            if slot is not None:
+                self.scheduled_slots[course.course_id] = slot
+            return slot
         for slot in available_slots:
-            if self._check_availability(course, slot):
+            slot_mask = slot.mask
+            if feasible & slot_mask == slot_mask:
                 self.scheduled_slots[course.course_id] = slot
                 return slot
         return None
     
-    def _check_availability(self, course: Course, slot: TimeSlot) -> bool:
-        """Check if slot is available for all requirements"""
-        # Check instructor availability
-        instructor_available = any(
-            self._slots_overlap(slot, instr_slot) 
-            for instr_slot in course.instructor.available_slots
-        )
-        
-        if not instructor_available:
-            return False
-        
-        # Check resource availability
-        for resource in course.required_resources:
-            resource_available = any(
-                self._slots_overlap(slot, res_slot)
-                for res_slot in resource.availability_hours
-            )
-            if not resource_available:
-                return False
-        
-        return True
+    def _first_default_slot(self, feasible: int) -> Optional[TimeSlot]:
+        """First-fit over the fixed default grid without visiting each slot"""
+        starts = _run_starts(feasible, _DEFAULT_SLOT_MINUTES) & _DEFAULT_SLOT_STARTS
+        if not starts:
+            return None
+        return _DEFAULT_SLOT_BY_START[(starts & -starts).bit_length() - 1]
     
-    def _slots_overlap(self, slot1: TimeSlot, slot2: TimeSlot) -> bool:
-        """Check if two time slots overlap"""
-        if slot1.day_of_week != slot2.day_of_week:
-            return False
-        return not (slot1.end_time <= slot2.start_time or slot1.start_time >= slot2.end_time)
+    def _feasible_mask(self, course: Course) -> int:
+        """Minutes of the week when the instructor and all resources are free"""
+        mask = course.instructor.avail_mask
+        for resource in course.required_resources:
+            mask &= resource.avail_mask
+        return mask
     
     def detect_conflicts(self, course: Course) -> List[ScheduleConflict]:
         """Detect conflicts for the course"""
@@ -273,10 +452,12 @@ class GreedyScheduler(Scheduler):
             ))
             return conflicts
         
+        # Availability must cover the whole scheduled slot
+        slot_mask = course.schedule.mask
+        
         # Check instructor conflict
         if course.instructor.available_slots:
-            if not any(self._slots_overlap(course.schedule, slot) 
-                      for slot in course.instructor.available_slots):
+            if course.instructor.avail_mask & slot_mask != slot_mask:
                 conflicts.append(ScheduleConflict(
                     course.course_id,
                     "instructor_unavailable",
@@ -286,8 +467,7 @@ class GreedyScheduler(Scheduler):
         # Check resource conflicts
         for resource in course.required_resources:
             if resource.availability_hours:
-                if not any(self._slots_overlap(course.schedule, slot)
-                          for slot in resource.availability_hours):
+                if resource.avail_mask & slot_mask != slot_mask:
                     conflicts.append(ScheduleConflict(
                         course.course_id,
                         "resource_unavailable",
@@ -312,7 +492,7 @@ class EmailNotificationHandler(NotificationHandler):
             'medium': 'email'
         }
         self.sent_notifications.append(notification)
-        print(f"[EMAIL] To: {recipient}\n{message}")
+        logger.info("[EMAIL] To: %s\n%s", recipient, message)
 
 
 class SlackNotificationHandler(NotificationHandler):
@@ -330,13 +510,35 @@ class SlackNotificationHandler(NotificationHandler):
             'medium': 'slack'
         }
         self.sent_notifications.append(notification)
-        print(f"[SLACK] To: {recipient}\n{message}")
+        logger.info("[SLACK] To: %s\n%s", recipient, message)
 
 
 # ============================================================================
 # Main Scheduling System
 # ============================================================================
 
+def _deliver_notification(message: str, recipient: str, handlers: Sequence[NotificationHandler]):
+    """Pass a notification to each handler, logging any handler that fails"""
+    for handler in handlers:
+        try:
+            handler.notify(message, recipient)
+        except Exception:
+            logger.exception("Failed to deliver notification to %s via %s",
+                             recipient, type(handler).__name__)
+
+
+def _dispatch_notifications(notify_queue: queue.Queue):
+    """Deliver queued notifications through their handlers until a None sentinel"""
+    while True:
+        item = notify_queue.get()
+        try:
+            if item is None:
+                return
+            _deliver_notification(*item)
+        finally:
+            notify_queue.task_done()
+
+
 class CourseSchedulingSystem:
     """Main system for managing course scheduling"""
     
@@ -346,8 +548,25 @@ class CourseSchedulingSystem:
         self.instructors: Dict[str, Instructor] = {}
         self.scheduler = scheduler or GreedyScheduler()
         self.notification_handlers: List[NotificationHandler] = []
+        self._notify_queue: queue.Queue = queue.Queue()
+        self._notify_thread: Optional[threading.Thread] = None
+        self._notify_stopper: Optional[weakref.finalize] = None
+        self._notify_closed = False
         self.conflict_history: List[ScheduleConflict] = []
-        self.lock = threading.RLock()
+        self._courses_by_level: Dict[CourseLevel, Dict[str, Course]] = {}
+        self._courses_by_status: Dict[ScheduleStatus, Dict[str, Course]] = {}
+        self._resources_by_type: Dict[ResourceType, Dict[str, Resource]] = {}
+        self._conflicts_by_course: Dict[str, List[ScheduleConflict]] = {}
+        self._conflicts_by_type: Dict[str, List[ScheduleConflict]] = {}
+        self._total_capacity = 0
+        self._course_counter = itertools.count()
+        self._total_enrolled = 0
+        # Guards writers only. Methods holding the lock never call another
+        # locking method, so a plain Lock suffices. Readers take no lock, so
+        # one running alongside a write may see it half applied (a course
+        # stored before its index entries and counters are updated), and
+        # must copy a dict before iterating it.
+        self.lock = threading.Lock()
     
     # ========================================================================
     # Resource Management
@@ -357,10 +576,11 @@ class CourseSchedulingSystem:
         """Add a resource to the system"""
         with self.lock:
             if resource.resource_id in self.resources:
-                print(f"Resource {resource.resource_id} already exists")
+                logger.warning("Resource %s already exists", resource.resource_id)
                 return False
             self.resources[resource.resource_id] = resource
-            print(f"Resource '{resource.name}' added successfully")
+            self._resources_by_type.setdefault(resource.resource_type, {})[resource.resource_id] = resource
+            logger.info("Resource '%s' added successfully", resource.name)
             return True
     
     def get_resource(self, resource_id: str) -> Optional[Resource]:
@@ -369,10 +589,9 @@ class CourseSchedulingSystem:
     
     def list_resources(self, resource_type: Optional[ResourceType] = None) -> List[Resource]:
         """List all resources or filter by type"""
-        resources = list(self.resources.values())
-        if resource_type:
-            resources = [r for r in resources if r.resource_type == resource_type]
-        return resources
+        if resource_type is None:
+            return list(self.resources.values())
+        return list(self._resources_by_type.get(resource_type, {}).values())
     
     # ========================================================================
     # Instructor Management
@@ -382,10 +601,10 @@ class CourseSchedulingSystem:
         """Register a new instructor"""
         with self.lock:
             if instructor.instructor_id in self.instructors:
-                print(f"Instructor {instructor.instructor_id} already registered")
+                logger.warning("Instructor %s already registered", instructor.instructor_id)
                 return False
             self.instructors[instructor.instructor_id] = instructor
-            print(f"Instructor '{instructor.name}' registered successfully")
+            logger.info("Instructor '%s' registered successfully", instructor.name)
             return True
     
     def get_instructor(self, instructor_id: str) -> Optional[Instructor]:
@@ -397,10 +616,10 @@ class CourseSchedulingSystem:
         with self.lock:
             instructor = self.instructors.get(instructor_id)
             if not instructor:
-                print(f"Instructor {instructor_id} not found")
+                logger.warning("Instructor %s not found", instructor_id)
                 return False
             instructor.available_slots = slots
-            print(f"Updated availability for instructor {instructor_id}")
+            logger.info("Updated availability for instructor %s", instructor_id)
             return True
     
     # ========================================================================
@@ -411,8 +630,9 @@ class CourseSchedulingSystem:
                      instructor: Instructor, duration_weeks: int,
                      capacity: int, resources: List[Resource] = None) -> Course:
         """Create a new course"""
+        # itertools.count.__next__ is atomic, so IDs are handed out outside the lock
+        course_id = f"c{next(self._course_counter):08x}"
         with self.lock:
-            course_id = str(uuid.uuid4())
             course = Course(
                 course_id=course_id,
                 name=name,
@@ -424,7 +644,10 @@ class CourseSchedulingSystem:
                 required_resources=resources or []
             )
             self.courses[course_id] = course
-            print(f"Course '{name}' created with ID {course_id}")
+            self._courses_by_level.setdefault(level, {})[course_id] = course
+            self._courses_by_status.setdefault(course.status, {})[course_id] = course
+            self._total_capacity += capacity
+            logger.info("Course '%s' created with ID %s", name, course_id)
             return course
     
     def get_course(self, course_id: str) -> Optional[Course]:
@@ -434,12 +657,21 @@ class CourseSchedulingSystem:
     def list_courses(self, level: Optional[CourseLevel] = None,
                     status: Optional[ScheduleStatus] = None) -> List[Course]:
         """List courses with optional filtering"""
-        courses = list(self.courses.values())
-        if level:
-            courses = [c for c in courses if c.level == level]
-        if status:
-            courses = [c for c in courses if c.status == status]
-        return courses
+        buckets = []
+        if level is not None:
+            buckets.append(self._courses_by_level.get(level, {}))
+        if status is not None:
+            buckets.append(self._courses_by_status.get(status, {}))
+        if not buckets:
+            return list(self.courses.values())
+        
+        smallest = min(buckets, key=len)
+        # Copy the bucket first, since writers may resize it while this runs
+        matches = [c for cid, c in list(smallest.items()) if all(cid in b for b in buckets)]
+        if status is not None:
+            # Status buckets follow transition order; IDs are handed out in creation order
+            matches.sort(key=lambda c: c.course_id)
+        return matches
     
     # ========================================================================
     # Scheduling Operations
@@ -470,7 +702,7 @@ class CourseSchedulingSystem:
             conflicts = self.scheduler.detect_conflicts(course)
             
             if conflicts:
-                self.conflict_history.extend(conflicts)
+                self._record_conflicts(conflicts)
                 conflict_summary = "; ".join([c.description for c in conflicts])
                 return False, f"Scheduling conflicts detected: {conflict_summary}"
             
@@ -480,7 +712,7 @@ class CourseSchedulingSystem:
                 course.instructor.email
             )
             
-            return True, f"Course scheduled for {assigned_slot.day_of_week} {assigned_slot.start_time}-{assigned_slot.end_time}"
+            return True, f"Course scheduled for {assigned_slot}"
     
     def reschedule_course(self, course_id: str, new_slot: TimeSlot) -> Tuple[bool, str]:
         """Reschedule an existing course"""
@@ -498,7 +730,7 @@ class CourseSchedulingSystem:
             if conflicts:
                 # Revert to old schedule
                 course.schedule = old_slot
-                self.conflict_history.extend(conflicts)
+                self._record_conflicts(conflicts)
                 return False, "Cannot reschedule: conflicts detected"
             
             # Notify about rescheduling
@@ -519,7 +751,7 @@ class CourseSchedulingSystem:
             if course.status != ScheduleStatus.SCHEDULED:
                 return False, f"Cannot start course with status {course.status.value}"
             
-            course.status = ScheduleStatus.ONGOING
+            self._set_status(course, ScheduleStatus.ONGOING)
             self._notify_all(
                 f"Course '{course.name}' has started",
                 course.instructor.email
@@ -536,7 +768,7 @@ class CourseSchedulingSystem:
             if course.status != ScheduleStatus.ONGOING:
                 return False, f"Cannot complete course with status {course.status.value}"
             
-            course.status = ScheduleStatus.COMPLETED
+            self._set_status(course, ScheduleStatus.COMPLETED)
             self._notify_all(
                 f"Course '{course.name}' has been completed",
                 course.instructor.email
@@ -550,7 +782,7 @@ class CourseSchedulingSystem:
             if not course:
                 return False, "Course not found"
             
-            course.status = ScheduleStatus.CANCELLED
+            self._set_status(course, ScheduleStatus.CANCELLED)
             message = f"Course '{course.name}' has been cancelled"
             if reason:
                 message += f": {reason}"
@@ -573,6 +805,7 @@ class CourseSchedulingSystem:
                 return False, "Course is at full capacity"
             
             course.enrolled_students += 1
+            self._total_enrolled += 1
             return True, f"Student {student_id} enrolled successfully"
     
     def get_course_capacity_info(self, course_id: str) -> Optional[Dict]:
@@ -596,12 +829,48 @@ class CourseSchedulingSystem:
     
     def register_notification_handler(self, handler: NotificationHandler):
         """Register a notification handler"""
-        self.notification_handlers.append(handler)
+        with self.lock:
+            self.notification_handlers.append(handler)
+            if self._notify_thread is None and not self._notify_closed:
+                # The thread only holds the queue, so it never keeps the system alive
+                self._notify_thread = threading.Thread(
+                    target=_dispatch_notifications,
+                    args=(self._notify_queue,),
+                    name="notification-dispatch",
+                    daemon=True
+                )
+                self._notify_thread.start()
+                # Stop the thread once the system is closed or garbage collected
+                self._notify_stopper = weakref.finalize(self, self._notify_queue.put, None)
+    
+    def flush_notifications(self):
+        """Block until every queued notification has been delivered"""
+        self._notify_queue.join()
+    
+    def close(self):
+        """Deliver pending notifications and stop the dispatch thread
+        
+        Notifications sent after close() are delivered synchronously.
+        """
+        with self.lock:
+            self._notify_closed = True
+            thread, self._notify_thread = self._notify_thread, None
+            stopper, self._notify_stopper = self._notify_stopper, None
+        if stopper is not None:
+            stopper()
+        if thread is not None:
+            thread.join()
     
     def _notify_all(self, message: str, recipient: str):
-        """Send notification through all registered handlers"""
-        for handler in self.notification_handlers:
-            handler.notify(message, recipient)
+        """Queue a notification for the dispatch thread; called with self.lock held"""
+        if not self.notification_handlers:
+            return
+        handlers = tuple(self.notification_handlers)
+        if self._notify_thread is not None:
+            self._notify_queue.put((message, recipient, handlers))
+        else:
+            # Closed, so there is no thread left to drain the queue
+            _deliver_notification(message, recipient, handlers)
     
     # ========================================================================
     # Conflict Detection and Reporting
@@ -609,41 +878,39 @@ class CourseSchedulingSystem:
     
     def get_course_conflicts(self, course_id: str) -> List[ScheduleConflict]:
         """Get all conflicts for a specific course"""
-        return [c for c in self.conflict_history if c.course_id == course_id]
+        return list(self._conflicts_by_course.get(course_id, []))
     
     def generate_conflict_report(self) -> Dict:
         """Generate a comprehensive conflict report"""
-        conflicts_by_type = {}
-        for conflict in self.conflict_history:
-            conflict_type = conflict.conflict_type
-            if conflict_type not in conflicts_by_type:
-                conflicts_by_type[conflict_type] = []
-            conflicts_by_type[conflict_type].append(conflict)
-        
+        report = self.generate_conflict_summary()
+        report['details'] = self.generate_conflict_details()
+        return report
+    
+    def generate_conflict_summary(self) -> Dict:
+        """Summarize conflicts by type without walking the history"""
         return {
             'total_conflicts': len(self.conflict_history),
-            'conflicts_by_type': {k: len(v) for k, v in conflicts_by_type.items()},
-            'details': [asdict(c) for c in self.conflict_history]
+            'conflicts_by_type': {k: len(v) for k, v in self._conflicts_by_type.items()}
         }
     
+    def generate_conflict_details(self) -> List[Dict]:
+        """Serialize every recorded conflict"""
+        return [c.to_dict() for c in self.conflict_history]
+    
     # ========================================================================
     # Analytics and Reporting
     # ========================================================================
     
     def get_system_statistics(self) -> Dict:
         """Get overall system statistics"""
-        total_capacity = sum(c.capacity for c in self.courses.values())
-        total_enrolled = sum(c.enrolled_students for c in self.courses.values())
-        
-        status_counts = {}
-        for course in self.courses.values():
-            status = course.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
+        total_capacity = self._total_capacity
+        total_enrolled = self._total_enrolled
         
-        level_counts = {}
-        for course in self.courses.values():
-            level = course.level.value
-            level_counts[level] = level_counts.get(level, 0) + 1
+        # Counts come straight from the level/status indexes
+        status_counts = {_STATUS_STR[status]: len(courses)
+                         for status, courses in self._courses_by_status.items() if courses}
+        level_counts = {_LEVEL_STR[level]: len(courses)
+                        for level, courses in self._courses_by_level.items() if courses}
         
         return {
             'total_courses': len(self.courses),
@@ -658,34 +925,63 @@ class CourseSchedulingSystem:
         }
     
     def export_system_state(self, filepath: str = "system_state.json"):
-        """Export complete system state to JSON"""
+        """Export complete system state to JSON
+        
+        Instructors and resources are serialized once; courses refer to them
+        by ID instead of embedding a copy in every course.
+        """
+        instructors = dict(self.instructors)
+        resources = dict(self.resources)
+        for course in self.courses.values():
+            instructors.setdefault(course.instructor.instructor_id, course.instructor)
+            for resource in course.required_resources:
+                resources.setdefault(resource.resource_id, resource)
+        
         state = {
             'timestamp': datetime.utcnow().isoformat(),
-            'courses': {cid: c.to_dict() for cid, c in self.courses.items()},
-            'instructors': {iid: i.to_dict() for iid, i in self.instructors.items()},
-            'resources': {rid: r.to_dict() for rid, r in self.resources.items()},
+            'courses': {cid: c.to_record() for cid, c in self.courses.items()},
+            'instructors': {iid: i.to_dict() for iid, i in instructors.items()},
+            'resources': {rid: r.to_dict() for rid, r in resources.items()},
             'statistics': self.get_system_statistics(),
             'conflicts': self.generate_conflict_report()
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(state, f, indent=2)
-        print(f"System state exported to {filepath}")
+        encoded = None
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits; the json module handles those
+                encoded = None
+        if encoded is not None:
+            with open(filepath, 'wb') as f:
+                f.write(encoded)
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(state, f, indent=2)
+        logger.info("System state exported to %s", filepath)
         return state
     
     # ========================================================================
     # Helper Methods
     # ========================================================================
     
-    def _generate_available_slots(self) -> List[TimeSlot]:
-        """Generate list of potential time slots"""
-        slots = []
-        for day in range(5):  # Monday to Friday
-            for hour in range(8, 18):  # 8 AM to 6 PM
-                start_time = f"{hour:02d}:00"
-                end_time = f"{hour + 1:02d}:00"
-                slots.append(TimeSlot(day, start_time, end_time))
-        return slots
+    def _set_status(self, course: Course, status: ScheduleStatus):
+        """Change a course status and keep the status index in sync"""
+        self._courses_by_status.get(course.status, {}).pop(course.course_id, None)
+        course.status = status
+        self._courses_by_status.setdefault(status, {})[course.course_id] = course
+    
+    def _record_conflicts(self, conflicts: List[ScheduleConflict]):
+        """Append conflicts to the history and the per-course/per-type indexes"""
+        self.conflict_history.extend(conflicts)
+        for conflict in conflicts:
+            self._conflicts_by_course.setdefault(conflict.course_id, []).append(conflict)
+            self._conflicts_by_type.setdefault(conflict.conflict_type, []).append(conflict)
+    
+    def _generate_available_slots(self) -> Sequence[TimeSlot]:
+        """Return the potential time slots (shared, do not mutate)"""
+        return _DEFAULT_SLOTS
 
 
 # ============================================================================
@@ -713,11 +1009,11 @@ def demonstrate_system():
         resource_type=ResourceType.CLASSROOM,
         capacity=30,
         availability_hours=[
-            TimeSlot(0, "08:00", "18:00"),
-            TimeSlot(1, "08:00", "18:00"),
-            TimeSlot(2, "08:00", "18:00"),
-            TimeSlot(3, "08:00", "18:00"),
-            TimeSlot(4, "08:00", "18:00")
+            TimeSlot.from_hhmm(0, "08:00", "18:00"),
+            TimeSlot.from_hhmm(1, "08:00", "18:00"),
+            TimeSlot.from_hhmm(2, "08:00", "18:00"),
+            TimeSlot.from_hhmm(3, "08:00", "18:00"),
+            TimeSlot.from_hhmm(4, "08:00", "18:00")
         ]
     )
     system.add_resource(classroom_a)
@@ -728,9 +1024,9 @@ def demonstrate_system():
         resource_type=ResourceType.LABORATORY,
         capacity=20,
         availability_hours=[
-            TimeSlot(0, "09:00", "17:00"),
-            TimeSlot(2, "09:00", "17:00"),
-            TimeSlot(4, "09:00", "17:00")
+            TimeSlot.from_hhmm(0, "09:00", "17:00"),
+            TimeSlot.from_hhmm(2, "09:00", "17:00"),
+            TimeSlot.from_hhmm(4, "09:00", "17:00")
         ]
     )
     system.add_resource(lab_a)
@@ -742,11 +1038,11 @@ def demonstrate_system():
         email="smith@example.com",
         specialization="Python Programming",
         available_slots=[
-            TimeSlot(0, "08:00", "12:00"),
-            TimeSlot(1, "08:00", "12:00"),
-            TimeSlot(2, "08:00", "12:00"),
-            TimeSlot(3, "08:00", "12:00"),
-            TimeSlot(4, "08:00", "12:00")
+            TimeSlot.from_hhmm(0, "08:00", "12:00"),
+            TimeSlot.from_hhmm(1, "08:00", "12:00"),
+            TimeSlot.from_hhmm(2, "08:00", "12:00"),
+            TimeSlot.from_hhmm(3, "08:00", "12:00"),
+            TimeSlot.from_hhmm(4, "08:00", "12:00")
         ],
         max_students=30
     )
@@ -758,9 +1054,9 @@ def demonstrate_system():
         email="johnson@example.com",
         specialization="Data Science",
         available_slots=[
-            TimeSlot(0, "14:00", "18:00"),
-            TimeSlot(2, "14:00", "18:00"),
-            TimeSlot(4, "14:00", "18:00")
+            TimeSlot.from_hhmm(0, "14:00", "18:00"),
+            TimeSlot.from_hhmm(2, "14:00", "18:00"),
+            TimeSlot.from_hhmm(4, "14:00", "18:00")
         ],
         max_students=25
     )
@@ -856,6 +1152,7 @@ def demonstrate_system():
     print("EXPORTING SYSTEM STATE")
     print("-" * 80)
     system.export_system_state()
+    system.close()
     
     print("\n" + "=" * 80)
     print("DEMO COMPLETED SUCCESSFULLY")
@@ -863,4 +1160,5 @@ def demonstrate_system():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     demonstrate_system()
@@ -4,7 +4,7 @@ Handles teacher, class, subject, period, and scheduling data structures.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Dict
+from typing import Callable, Iterable, List, Optional, Set, Dict, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -23,14 +23,71 @@ class ConstraintType(Enum):
     SOFT = "soft"  # Should be satisfied if possible
 
 
-@dataclass
-class Teacher:
+DAYS_OF_WEEK = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MAX_PERIODS_PER_DAY = 16  # Bits reserved per day in period bitmasks
+
+_DAY_INDEX = {name.lower(): index for index, name in enumerate(DAYS_OF_WEEK)}
+
+
+def encode_day_period(day: int, period: int) -> int:
+    """Bit index of a (day, period) pair in a period bitmask."""
+    if not 0 <= day < len(DAYS_OF_WEEK):
+        raise ValueError(f"Day {day} out of range 0-{len(DAYS_OF_WEEK) - 1}")
+    if not 0 <= period < MAX_PERIODS_PER_DAY:
+        raise ValueError(f"Period {period} out of range 0-{MAX_PERIODS_PER_DAY - 1}")
+    return day * MAX_PERIODS_PER_DAY + period
+
+
+def parse_day_period(value: str) -> int:
+    """Bit index of a "day_period" string such as "Monday_3" or "0_3"."""
+    day, period = value.rsplit("_", 1)
+    try:
+        day_index = int(day)
+    except ValueError:
+        day_index = _DAY_INDEX.get(day.lower(), -1)
+        if day_index < 0:
+            raise ValueError(f"Unknown day {day!r}") from None
+    return encode_day_period(day_index, int(period))
+
+
+def periods_to_mask(periods: Iterable[str],
+                    encode_fn: Callable[[str], int] = parse_day_period) -> int:
+    """Build a period bitmask from "day_period" strings."""
+    mask = 0
+    for period in periods:
+        mask |= 1 << encode_fn(period)
+    return mask
+
+
+class _UnavailablePeriods:
+    """
+    Mixin for models with an unavailable_periods field.
+    
+    The field is a bitmask with bit encode_day_period(day, period) set for
+    each blocked period. An iterable of "day_period" strings is accepted on
+    construction and converted with periods_to_mask.
+    """
+    __slots__ = ()
+
+    unavailable_periods: int
+
+    def __post_init__(self):
+        if not isinstance(self.unavailable_periods, int):
+            self.unavailable_periods = periods_to_mask(self.unavailable_periods)
+
+    def is_unavailable(self, day: int, period: int) -> bool:
+        """Check if the given period is blocked."""
+        return bool(self.unavailable_periods >> encode_day_period(day, period) & 1)
+
+
+@dataclass(eq=False, slots=True)
+class Teacher(_UnavailablePeriods):
     """Represents a teacher in the system."""
     teacher_id: str
     name: str
     subject_codes: List[str] = field(default_factory=list)
     max_daily_periods: int = 6
-    unavailable_periods: Set[str] = field(default_factory=set)  # Format: "day_period"
+    unavailable_periods: int = 0  # Bitmask, see _UnavailablePeriods
     preferred_periods: Set[str] = field(default_factory=set)
     special_rooms: List[str] = field(default_factory=list)
     groups: List[str] = field(default_factory=list)  # Teaching groups
@@ -46,8 +103,8 @@ class Teacher:
         return False
 
 
-@dataclass
-class SchoolClass:
+@dataclass(eq=False, slots=True)
+class SchoolClass(_UnavailablePeriods):
     """Represents a class in the school."""
     class_id: str
     name: str
@@ -55,7 +112,7 @@ class SchoolClass:
     total_students: int
     special_needs_count: int = 0
     available_rooms: List[str] = field(default_factory=list)
-    unavailable_periods: Set[str] = field(default_factory=set)  # Format: "day_period"
+    unavailable_periods: int = 0  # Bitmask, see _UnavailablePeriods
     constraints: Dict[str, str] = field(default_factory=dict)
 
     def __hash__(self):
@@ -67,7 +124,7 @@ class SchoolClass:
         return False
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Subject:
     """Represents a subject."""
     subject_code: str
@@ -87,7 +144,7 @@ class Subject:
         return False
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Period:
     """Represents a time period in the schedule."""
     period_id: str
@@ -106,15 +163,15 @@ class Period:
         return False
 
 
-@dataclass
-class Room:
+@dataclass(eq=False, slots=True)
+class Room(_UnavailablePeriods):
     """Represents a classroom or special room."""
     room_id: str
     name: str
     room_type: str  # "classroom", "lab", "gym", "music_room", etc.
     capacity: int
     special_equipment: List[str] = field(default_factory=list)
-    unavailable_periods: Set[str] = field(default_factory=set)  # Format: "day_period"
+    unavailable_periods: int = 0  # Bitmask, see _UnavailablePeriods
 
     def __hash__(self):
         return hash(self.room_id)
@@ -125,7 +182,7 @@ class Room:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Course:
     """Represents a course assignment (teacher teaching subject to class)."""
     course_id: str
@@ -139,7 +196,7 @@ class Course:
     priority: int = 1  # 1=high, 2=medium, 3=low
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class ScheduledSlot:
     """Represents a scheduled course slot."""
     slot_id: str
@@ -147,7 +204,11 @@ class ScheduledSlot:
     period: Period
     room: Room
     assigned_date: datetime
-    groups_assigned: List[str] = field(default_factory=list)
+    groups_assigned: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        if not isinstance(self.groups_assigned, tuple):
+            self.groups_assigned = tuple(self.groups_assigned)
 
     def __hash__(self):
         return hash(self.slot_id)
@@ -158,7 +219,7 @@ class ScheduledSlot:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulingConstraint:
     """Represents a scheduling constraint."""
     constraint_id: str
@@ -170,7 +231,7 @@ class SchedulingConstraint:
     weight: float = 1.0  # For soft constraints, weight in optimization
 
 
-@dataclass
+@dataclass(slots=True)
 class Schedule:
     """Represents the complete schedule."""
     schedule_id: str
@@ -186,7 +247,7 @@ class Schedule:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdjustmentRequest:
     """Represents a manual adjustment request."""
     adjustment_id: str
@@ -11,26 +11,153 @@ Author: TeacherWang995
 
 import json
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from abc import ABC, abstractmethod
+from typing import IO, List, Dict, Any, Callable, Iterable, Iterator, MutableMapping, Optional, Tuple
+from abc import ABC
 from io import StringIO
+from itertools import compress, repeat
+from operator import eq, itemgetter, methodcaller
+
+try:
+    import orjson
+except ImportError:  # optional, only speeds up JSON output
+    orjson = None  # type: ignore[assignment]
+
+
+# Static parts of the HTML document, shared by every HTML report
+_HTML_STYLE = "\n".join([
+    "<style>",
+    "body { font-family: Arial, sans-serif; margin: 20px; }",
+    "table { border-collapse: collapse; width: 100%; }",
+    "th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
+    "th { background-color: #4CAF50; color: white; }",
+    "tr:nth-child(even) { background-color: #f2f2f2; }",
+    ".header { color: #333; margin-bottom: 10px; }",
+    ".timestamp { color: #666; font-size: 0.9em; }",
+    "</style>",
+])
+_HTML_EPILOGUE = "</body>\n</html>"
+
+# Below this many records, starting worker processes costs more than it saves
+_PARALLEL_MIN_RECORDS = 1000
+
+# From this many records, JSON is streamed to the sink with the json module
+# instead of built whole with orjson, so float spelling changes at this size
+_JSON_STREAM_MIN_RECORDS = 10000
+
+# Same entities as html.escape(quote=True), applied in a single pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def rows_to_columns(data: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Convert row-oriented schedule data to columnar form.
+    
+    Column names are taken from the first row; missing values become None.
+    
+    Args:
+        data: List of schedule dictionaries
+        
+    Returns:
+        Dictionary mapping each column name to its list of values
+    """
+    if not data:
+        return {}
+    return {key: [row.get(key) for row in data] for key in data[0]}
+
+
+def columns_to_rows(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert columnar schedule data back to a list of row dictionaries.
+    
+    Args:
+        columns: Dictionary mapping column names to equal-length value lists
+        
+    Returns:
+        List of schedule dictionaries
+    """
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+def _column_length(columns: Dict[str, List[Any]]) -> int:
+    """Number of records held in columnar data."""
+    return len(next(iter(columns.values()), []))
+
+
+def _orjson_dumps(report: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Serialize the report with orjson when it is installed.
+    
+    orjson output is valid JSON but not byte-identical to json.dumps:
+    NaN and infinity become null, and floats are spelled differently
+    (1e16 rather than 1e+16, 1e-7 rather than 1e-07).
+    
+    Args:
+        report: Report dictionary
+        
+    Returns:
+        Indented UTF-8 JSON, or None when orjson is missing or cannot
+        encode the report (e.g. integers wider than 64 bits)
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return None
 
 
 class ReportGenerator(ABC):
     """Abstract base class for report generators."""
     
-    def __init__(self, title: str = "Schedule Report"):
+    def __init__(self, title: str = "Schedule Report") -> None:
         """
         Initialize the report generator.
         
         Args:
             title: Title of the report
         """
-        self.title = title
-        self.timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        self.title: str = title
+        self._timestamp: Optional[str] = None
+    
+    @property
+    def timestamp(self) -> str:
+        """Report timestamp, formatted on first access."""
+        if self._timestamp is None:
+            self._timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: str) -> None:
+        self._timestamp = value
+    
+    def refresh_timestamp(self) -> None:
+        """Reset the timestamp so the next report records the current time."""
+        self._timestamp = None
+    
+    def generate_to(self, sink: IO[str], data: List[Dict[str, Any]]) -> None:
+        """
+        Write report for schedule data to a text sink.
+        
+        Subclasses override this or generate(); each default is written
+        in terms of the other.
+        
+        Args:
+            sink: Writable text stream (file, StringIO, socket wrapper)
+            data: List of schedule dictionaries
+        """
+        if type(self).generate is ReportGenerator.generate:
+            raise NotImplementedError(f"{type(self).__name__} must override generate() or generate_to()")
+        sink.write(self.generate(data))
     
-    @abstractmethod
     def generate(self, data: List[Dict[str, Any]]) -> str:
         """
         Generate report from schedule data.
@@ -41,29 +168,73 @@ class ReportGenerator(ABC):
         Returns:
             Formatted report as string
         """
-        pass
+        if type(self).generate_to is ReportGenerator.generate_to:
+            raise NotImplementedError(f"{type(self).__name__} must override generate() or generate_to()")
+        output = StringIO()
+        self.generate_to(output, data)
+        return output.getvalue()
+    
+    def generate_columnar(self, columns: Dict[str, List[Any]]) -> str:
+        """
+        Generate report from columnar schedule data.
+        
+        Subclasses override this to work on the columns directly; the
+        default converts back to rows.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
+            
+        Returns:
+            Formatted report as string
+        """
+        return self.generate(columns_to_rows(columns))
 
 
 class CSVReportGenerator(ReportGenerator):
     """Generate schedule reports in CSV format."""
     
-    def generate(self, data: List[Dict[str, Any]]) -> str:
+    def generate_to(self, sink: IO[str], data: List[Dict[str, Any]]) -> None:
         """
-        Generate CSV formatted report.
+        Write CSV formatted report to a sink.
         
         Args:
+            sink: Writable text stream
             data: List of schedule dictionaries
             
+        Raises:
+            ValueError: If a row has fields that are not in the first row
+        """
+        if not data:
+            return
+        
+        keys = list(data[0].keys())
+        header = set(keys)
+        if not all(map(header.issuperset, data)):
+            # Same check and message as csv.DictWriter
+            extra = next(row.keys() - header for row in data if not header.issuperset(row))
+            raise ValueError("dict contains fields not in fieldnames: " + ", ".join(map(repr, extra)))
+        blanks = repeat('')
+        writer = csv.writer(sink)
+        writer.writerow(keys)
+        writer.writerows(map(row.get, keys, blanks) for row in data)
+    
+    def generate_columnar(self, columns: Dict[str, List[Any]]) -> str:
+        """
+        Generate CSV formatted report from columnar data.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
+            
         Returns:
             CSV formatted string
         """
-        if not data:
+        if not _column_length(columns):
             return ""
         
         output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=data[0].keys())
-        writer.writeheader()
-        writer.writerows(data)
+        writer = csv.writer(output)
+        writer.writerow(columns.keys())
+        writer.writerows(zip(*columns.values()))
         
         return output.getvalue()
 
@@ -71,6 +242,22 @@ class CSVReportGenerator(ReportGenerator):
 class JSONReportGenerator(ReportGenerator):
     """Generate schedule reports in JSON format."""
     
+    def __init__(
+        self,
+        title: str = "Schedule Report",
+        row_cache: Optional[Dict[int, Tuple[Dict[str, Any], str]]] = None
+    ) -> None:
+        """
+        Initialize the JSON report generator.
+        
+        Args:
+            title: Title of the report
+            row_cache: Optional shared cache of encoded rows keyed by id(row).
+                Rows must not be mutated while they are cached.
+        """
+        super().__init__(title)
+        self.row_cache: Optional[Dict[int, Tuple[Dict[str, Any], str]]] = row_cache
+    
     def generate(self, data: List[Dict[str, Any]]) -> str:
         """
         Generate JSON formatted report.
@@ -78,135 +265,323 @@ class JSONReportGenerator(ReportGenerator):
         Args:
             data: List of schedule dictionaries
             
+        Returns:
+            JSON formatted string
+        """
+        if self.row_cache is not None:
+            return super().generate(data)
+        return self._dumps(self._build_report(data))
+    
+    def generate_to(self, sink: IO[str], data: List[Dict[str, Any]]) -> None:
+        """
+        Write JSON formatted report to a sink.
+        
+        Reports of _JSON_STREAM_MIN_RECORDS records or more are streamed
+        with json.dump, smaller ones are encoded whole with orjson when it
+        is installed. Each report uses a single encoder, but NaN and float
+        spelling differ between the two (see _orjson_dumps).
+        
+        Args:
+            sink: Writable text stream
+            data: List of schedule dictionaries
+        """
+        if self.row_cache is not None:
+            self._write_cached(sink, data, self.row_cache)
+            return
+        
+        report = self._build_report(data)
+        if orjson is not None and len(data) < _JSON_STREAM_MIN_RECORDS:
+            sink.write(self._dumps(report))
+        else:
+            # json.dump writes the encoder's chunks as they are produced
+            json.dump(report, sink, indent=2, ensure_ascii=False)
+    
+    def generate_bytes(self, data: List[Dict[str, Any]]) -> bytes:
+        """
+        Generate JSON formatted report as UTF-8 bytes.
+        
+        Avoids decoding orjson output when the result is written to a
+        binary file or socket anyway.
+        
+        Args:
+            data: List of schedule dictionaries
+            
+        Returns:
+            UTF-8 encoded JSON
+        """
+        report = self._build_report(data)
+        encoded = _orjson_dumps(report)
+        if encoded is not None:
+            return encoded
+        return json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    def generate_columnar(self, columns: Dict[str, List[Any]]) -> str:
+        """
+        Generate JSON formatted report from columnar data.
+        
+        The data is emitted as a "columns" object of value lists rather
+        than a list of records.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
+            
         Returns:
             JSON formatted string
         """
         report = {
+            "title": self.title,
+            "timestamp": self.timestamp,
+            "total_records": _column_length(columns),
+            "columns": columns
+        }
+        
+        return self._dumps(report)
+    
+    def _build_report(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wrap the records with the report metadata."""
+        return {
             "title": self.title,
             "timestamp": self.timestamp,
             "total_records": len(data),
             "data": data
         }
-        
+    
+    def _write_cached(
+        self,
+        sink: IO[str],
+        data: List[Dict[str, Any]],
+        row_cache: Dict[int, Tuple[Dict[str, Any], str]]
+    ) -> None:
+        """Write the report, reusing encoded rows from the row cache."""
+        sink.write(
+            '{\n  "title": ' + json.dumps(self.title, ensure_ascii=False)
+            + ',\n  "timestamp": ' + json.dumps(self.timestamp, ensure_ascii=False)
+            + f',\n  "total_records": {len(data)},\n  "data": '
+        )
+        if not data:
+            sink.write("[]\n}")
+            return
+        sink.write("[\n" + self._encode_row(data[0], row_cache))
+        sink.writelines(",\n" + self._encode_row(row, row_cache) for row in data[1:])
+        sink.write("\n  ]\n}")
+    
+    def _encode_row(self, row: Dict[str, Any], row_cache: Dict[int, Tuple[Dict[str, Any], str]]) -> str:
+        """Encode a row at the nesting depth of the "data" list, memoized in row_cache."""
+        entry = row_cache.get(id(row))
+        # The cache holds a reference to the row, so its id cannot be reused
+        if entry is not None and entry[0] is row:
+            return entry[1]
+        encoded = "\n".join("    " + line for line in self._dumps(row).split("\n"))
+        row_cache[id(row)] = (row, encoded)
+        return encoded
+    
+    def _dumps(self, report: Dict[str, Any]) -> str:
+        """Serialize the report, using orjson when it is installed."""
+        encoded = _orjson_dumps(report)
+        if encoded is not None:
+            return encoded.decode("utf-8")
         return json.dumps(report, indent=2, ensure_ascii=False)
 
 
 class HTMLReportGenerator(ReportGenerator):
     """Generate schedule reports in HTML format."""
     
-    def generate(self, data: List[Dict[str, Any]]) -> str:
+    def generate_to(self, sink: IO[str], data: List[Dict[str, Any]]) -> None:
         """
-        Generate HTML formatted report.
+        Write HTML formatted report to a sink.
         
         Args:
+            sink: Writable text stream
             data: List of schedule dictionaries
+        """
+        keys = list(data[0].keys()) if data else []
+        blanks = repeat('')
+        # Look cells up in the first row's column order; missing cells render empty
+        self._render(sink, keys, (map(row.get, keys, blanks) for row in data))
+    
+    def generate_columnar(self, columns: Dict[str, List[Any]]) -> str:
+        """
+        Generate HTML formatted report from columnar data.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
             
         Returns:
             HTML formatted string
         """
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            f"<title>{self.title}</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; margin: 20px; }",
-            "table { border-collapse: collapse; width: 100%; }",
-            "th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
-            "th { background-color: #4CAF50; color: white; }",
-            "tr:nth-child(even) { background-color: #f2f2f2; }",
-            ".header { color: #333; margin-bottom: 10px; }",
-            ".timestamp { color: #666; font-size: 0.9em; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            f"<h1>{self.title}</h1>",
-            f"<p class='timestamp'>Generated: {self.timestamp} UTC</p>",
-        ]
+        keys = list(columns) if _column_length(columns) else []
+        output = StringIO()
+        self._render(output, keys, zip(*columns.values()))
+        return output.getvalue()
+    
+    def _render(self, sink: IO[str], keys: List[str], rows: Iterable[Iterable[Any]]) -> None:
+        """Write the HTML document for the given columns and row values."""
+        sink.write(
+            f"<!DOCTYPE html>\n<html>\n<head>\n<title>{self.title}</title>\n{_HTML_STYLE}\n"
+            f"</head>\n<body>\n<h1>{self.title}</h1>\n"
+            f"<p class='timestamp'>Generated: {self.timestamp} UTC</p>\n"
+        )
         
-        if data:
-            html_parts.append("<table>")
-            html_parts.append("<thead><tr>")
-            
+        if keys:
             # Generate table headers
-            for key in data[0].keys():
-                html_parts.append(f"<th>{key}</th>")
+            header = "".join(f"<th>{str(key).translate(_HTML_ESCAPE_TABLE)}</th>" for key in keys)
+            sink.write(f"<table>\n<thead><tr>{header}</tr></thead>\n<tbody>\n")
             
-            html_parts.append("</tr></thead>")
-            html_parts.append("<tbody>")
+            # Generate table rows from a template fixed by the column count
+            row_template = "<tr>" + "<td>%s</td>" * len(keys) + "</tr>\n"
+            translate = str.translate
+            for row in rows:
+                sink.write(row_template % tuple(
+                    translate(str(value), _HTML_ESCAPE_TABLE) for value in row
+                ))
             
-            # Generate table rows
-            for row in data:
-                html_parts.append("<tr>")
-                for value in row.values():
-                    html_parts.append(f"<td>{value}</td>")
-                html_parts.append("</tr>")
-            
-            html_parts.append("</tbody>")
-            html_parts.append("</table>")
+            sink.write("</tbody>\n</table>\n")
         else:
-            html_parts.append("<p>No data to display.</p>")
-        
-        html_parts.extend([
-            "</body>",
-            "</html>"
-        ])
+            sink.write("<p>No data to display.</p>\n")
         
-        return "\n".join(html_parts)
+        sink.write(_HTML_EPILOGUE)
 
 
 class PlainTextReportGenerator(ReportGenerator):
     """Generate schedule reports in plain text format."""
     
-    def generate(self, data: List[Dict[str, Any]]) -> str:
+    def generate_to(self, sink: IO[str], data: List[Dict[str, Any]]) -> None:
         """
-        Generate plain text formatted report.
+        Write plain text formatted report to a sink.
         
         Args:
+            sink: Writable text stream
             data: List of schedule dictionaries
+        """
+        keys = tuple(data[0]) if data else ()
+        template = self._record_template(keys)
+        
+        def blocks() -> Iterator[str]:
+            for record in data:
+                if tuple(record) == keys:
+                    yield template % tuple(record.values())
+                else:
+                    # Rows with a different schema are formatted field by field
+                    yield "\n".join(f"{key:.<20} {value}" for key, value in record.items())
+        
+        self._render(sink, blocks(), len(data))
+    
+    def generate_columnar(self, columns: Dict[str, List[Any]]) -> str:
+        """
+        Generate plain text formatted report from columnar data.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
             
         Returns:
             Plain text formatted string
         """
-        lines = [
+        template = self._record_template(tuple(columns))
+        blocks = (template % values for values in zip(*columns.values()))
+        output = StringIO()
+        self._render(output, blocks, _column_length(columns))
+        return output.getvalue()
+    
+    @staticmethod
+    def _record_template(keys: Tuple[Any, ...]) -> str:
+        """Build a %-template that formats one record's values in key order."""
+        return "\n".join(f"{key:.<20} ".replace("%", "%%") + "%s" for key in keys)
+    
+    def _render(self, sink: IO[str], blocks: Iterable[str], count: int) -> None:
+        """Write the text report from the formatted field block of each record."""
+        header = [
             "=" * 70,
             self.title.center(70),
             "=" * 70,
             f"Generated: {self.timestamp} UTC",
             "-" * 70,
         ]
+        sink.write("\n".join(header))
         
-        if not data:
-            lines.append("No data to display.")
-            lines.append("=" * 70)
-            return "\n".join(lines)
+        if not count:
+            sink.write("\nNo data to display.\n" + "=" * 70)
+            return
         
         # Format each record
-        for idx, record in enumerate(data, 1):
-            lines.append(f"Record #{idx}")
-            lines.append("-" * 30)
-            for key, value in record.items():
-                lines.append(f"{key:.<20} {value}")
-            lines.append("")
+        rule = "-" * 30
+        for idx, block in enumerate(blocks, 1):
+            if block:
+                sink.write(f"\nRecord #{idx}\n{rule}\n{block}\n")
+            else:
+                sink.write(f"\nRecord #{idx}\n{rule}\n")
         
-        lines.append("=" * 70)
-        lines.append(f"Total Records: {len(data)}")
-        lines.append("=" * 70)
+        sink.write("\n" + "\n".join([
+            "=" * 70,
+            f"Total Records: {count}",
+            "=" * 70,
+        ]))
+
+
+class _LazyGenerators(MutableMapping[str, ReportGenerator]):
+    """Generators keyed by format, each created by its factory on first access."""
+    
+    def __init__(self, factories: Dict[str, Callable[[], ReportGenerator]]) -> None:
+        """
+        Initialize the mapping.
         
-        return "\n".join(lines)
+        Args:
+            factories: Dictionary mapping format names to generator factories
+        """
+        self.factories = dict(factories)
+        self._generators: Dict[str, ReportGenerator] = {}
+        # Formats in registration order; values are unused
+        self._formats: Dict[str, None] = dict.fromkeys(factories)
+    
+    def __getitem__(self, format: str) -> ReportGenerator:
+        generator = self._generators.get(format)
+        if generator is None:
+            generator = self._generators[format] = self.factories[format]()
+        return generator
+    
+    def __setitem__(self, format: str, generator: ReportGenerator) -> None:
+        # An assigned generator replaces the factory for its format
+        self.factories.pop(format, None)
+        self._generators[format] = generator
+        self._formats.setdefault(format)
+    
+    def __delitem__(self, format: str) -> None:
+        del self._formats[format]
+        self.factories.pop(format, None)
+        self._generators.pop(format, None)
+    
+    def __contains__(self, format: object) -> bool:
+        return format in self._formats
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._formats)
+    
+    def __len__(self) -> int:
+        return len(self._formats)
 
 
 class ScheduleReportManager:
     """Manager class for generating schedule reports in multiple formats."""
     
-    def __init__(self):
-        """Initialize the report manager with available generators."""
-        self.generators = {
-            "csv": CSVReportGenerator(),
-            "json": JSONReportGenerator(),
-            "html": HTMLReportGenerator(),
-            "text": PlainTextReportGenerator(),
-        }
+    def __init__(self, cache_json_rows: bool = False) -> None:
+        """
+        Initialize the report manager with available generator factories.
+        
+        Args:
+            cache_json_rows: Reuse each row's JSON encoding across reports.
+                Cached rows are kept alive and must not be mutated until
+                clear_cache() is called.
+        """
+        self._json_row_cache: Optional[Dict[int, Tuple[Dict[str, Any], str]]] = {} if cache_json_rows else None
+        self.generators = _LazyGenerators({
+            "csv": CSVReportGenerator,
+            "json": lambda: JSONReportGenerator(row_cache=self._json_row_cache),
+            "html": HTMLReportGenerator,
+            "text": PlainTextReportGenerator,
+        })
+    
+    def _get_generator(self, format: str) -> Optional[ReportGenerator]:
+        """Return the generator for a format, creating it on first use."""
+        return self.generators.get(format)
     
     def generate_report(
         self,
@@ -225,14 +600,75 @@ class ScheduleReportManager:
         Returns:
             Formatted report string or None if format is invalid
         """
-        if format not in self.generators:
-            print(f"Error: Invalid format '{format}'. Supported formats: {list(self.generators.keys())}")
+        generator = self._get_generator(format)
+        if generator is None:
             return None
-        
-        generator = self.generators[format]
         generator.title = title
+        generator.refresh_timestamp()
         return generator.generate(data)
     
+    def generate_report_columnar(
+        self,
+        columns: Dict[str, List[Any]],
+        format: str = "json",
+        title: str = "Schedule Report"
+    ) -> Optional[str]:
+        """
+        Generate a report in the specified format from columnar data.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
+            format: Output format ('csv', 'json', 'html', 'text')
+            title: Report title
+            
+        Returns:
+            Formatted report string or None if format is invalid
+        """
+        generator = self._get_generator(format)
+        if generator is None:
+            return None
+        generator.title = title
+        generator.refresh_timestamp()
+        return generator.generate_columnar(columns)
+    
+    def generate_all(
+        self,
+        data: List[Dict[str, Any]],
+        formats: Optional[Iterable[str]] = None,
+        title: str = "Schedule Report"
+    ) -> Dict[str, Optional[str]]:
+        """
+        Generate the same data in several formats.
+        
+        Large datasets are rendered in a process pool, one format per
+        worker; small ones are rendered sequentially in this process.
+        
+        Args:
+            data: List of schedule dictionaries
+            formats: Output formats (defaults to all supported formats)
+            title: Report title
+            
+        Returns:
+            Dictionary mapping each format to its report, or None if the
+            format is invalid
+        """
+        formats = list(self.generators if formats is None else formats)
+        # Workers build their own manager, so only factory-made generators can run there
+        pooled = [format for format in formats if format in self.generators.factories]
+        if len(data) < _PARALLEL_MIN_RECORDS or len(pooled) < 2:
+            return {format: self.generate_report(data, format, title) for format in formats}
+        
+        with ProcessPoolExecutor(max_workers=len(pooled)) as executor:
+            futures = {
+                format: executor.submit(_generate_report_in_worker, data, format, title)
+                for format in pooled
+            }
+            return {
+                format: futures[format].result() if format in futures
+                else self.generate_report(data, format, title)
+                for format in formats
+            }
+    
     def filter_schedule(
         self,
         data: List[Dict[str, Any]],
@@ -250,7 +686,9 @@ class ScheduleReportManager:
         Returns:
             Filtered list of dictionaries
         """
-        return [record for record in data if record.get(filter_key) == filter_value]
+        # map/compress keep the per-row work in C instead of a Python loop
+        column = map(methodcaller("get", filter_key), data)
+        return list(compress(data, map(eq, column, repeat(filter_value))))
     
     def sort_schedule(
         self,
@@ -269,8 +707,69 @@ class ScheduleReportManager:
         Returns:
             Sorted list of dictionaries
         """
+        if all(sort_key in record for record in data):
+            return sorted(data, key=itemgetter(sort_key), reverse=reverse)
         return sorted(data, key=lambda x: x.get(sort_key, ""), reverse=reverse)
     
+    def filter_columns(
+        self,
+        columns: Dict[str, List[Any]],
+        filter_key: str,
+        filter_value: Any
+    ) -> Dict[str, List[Any]]:
+        """
+        Filter columnar schedule data by a specific key-value pair.
+        
+        Only the filter column is scanned; the other columns are gathered
+        by the matching indices.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
+            filter_key: Column to filter by
+            filter_value: Value to match
+            
+        Returns:
+            Filtered columnar data
+        """
+        column = columns.get(filter_key)
+        if column is None:
+            column = [None] * _column_length(columns)
+        indices = [idx for idx, value in enumerate(column) if value == filter_value]
+        return {key: [values[idx] for idx in indices] for key, values in columns.items()}
+    
+    def sort_columns(
+        self,
+        columns: Dict[str, List[Any]],
+        sort_key: str,
+        reverse: bool = False
+    ) -> Dict[str, List[Any]]:
+        """
+        Sort columnar schedule data by a specific key.
+        
+        Args:
+            columns: Dictionary mapping column names to equal-length value lists
+            sort_key: Column to sort by
+            reverse: Sort in reverse order
+            
+        Returns:
+            Sorted columnar data
+        """
+        column = columns.get(sort_key)
+        if column is None:
+            return {key: list(values) for key, values in columns.items()}
+        order = sorted(range(len(column)), key=column.__getitem__, reverse=reverse)
+        return {key: [values[idx] for idx in order] for key, values in columns.items()}
+    
+    def clear_cache(self) -> None:
+        """
+        Drop cached JSON row encodings.
+        
+        Call this after mutating rows that have already been reported, or
+        to release the rows held by the cache.
+        """
+        if self._json_row_cache is not None:
+            self._json_row_cache.clear()
+    
     def get_supported_formats(self) -> List[str]:
         """
         Get list of supported report formats.
@@ -278,7 +777,16 @@ class ScheduleReportManager:
         Returns:
             List of supported format names
         """
-        return list(self.generators.keys())
+        return list(self.generators)
+
+
+def _generate_report_in_worker(
+    data: List[Dict[str, Any]],
+    format: str,
+    title: str
+) -> Optional[str]:
+    """Render one report in a worker process for generate_all."""
+    return ScheduleReportManager().generate_report(data, format, title)
 
 
 # Example usage and testing
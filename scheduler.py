@@ -6,10 +6,16 @@ including constraint validation, conflict detection, and schedule optimization.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Tuple, Optional
+from typing import IO, Any, Callable, FrozenSet, Iterable, List, Dict, Sequence, Set, Tuple, Optional
 from enum import Enum
+from io import StringIO
+from operator import itemgetter
 from datetime import datetime, time, timedelta
 import json
+import sys
+
+
+MINUTES_PER_DAY = 24 * 60
 
 
 class DayOfWeek(Enum):
@@ -29,37 +35,90 @@ class ConstraintType(Enum):
     SOFT = "soft"  # Should be satisfied but can be violated
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class TimeSlot:
     """Represents a time slot for scheduling."""
     day: DayOfWeek
     start_time: time
     end_time: time
+    # Day number and minutes since the start of the week, derived from the fields above
+    _day: int = field(init=False, repr=False, compare=False)
+    _start: int = field(init=False, repr=False, compare=False)
+    _end: int = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    # Bit i is set for each minute i of the week covered by the slot
+    _mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._day = self.day.value
+        day_start = self._day * MINUTES_PER_DAY
+        self._start = day_start + self.start_time.hour * 60 + self.start_time.minute
+        self._end = day_start + self.end_time.hour * 60 + self.end_time.minute
+        self._hash = hash((self._start, self._end))
+        self._mask = ((1 << (self._end - self._start)) - 1) << self._start if self._end > self._start else 0
 
     def overlaps_with(self, other: 'TimeSlot') -> bool:
         """Check if this time slot overlaps with another."""
-        if self.day != other.day:
-            return False
-        return not (self.end_time <= other.start_time or self.start_time >= other.end_time)
+        # Slots on different days can never overlap as week minutes
+        return self._start < other._end and other._start < self._end
 
     def duration_minutes(self) -> int:
         """Calculate duration in minutes."""
-        start_minutes = self.start_time.hour * 60 + self.start_time.minute
-        end_minutes = self.end_time.hour * 60 + self.end_time.minute
-        return end_minutes - start_minutes
+        return self._end - self._start
 
     def __hash__(self):
-        return hash((self.day, self.start_time, self.end_time))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, TimeSlot):
             return False
-        return (self.day == other.day and 
+        return (self._day == other._day and 
                 self.start_time == other.start_time and 
                 self.end_time == other.end_time)
 
 
-@dataclass
+def _intern(value):
+    """Intern a string ID; other values, which validation may reject later, pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _slots_mask(slots: Iterable[TimeSlot]) -> int:
+    """Combine the minute masks of several time slots."""
+    mask = 0
+    for slot in slots:
+        mask |= slot._mask
+    return mask
+
+
+class _ListMask:
+    """
+    Bitmask derived from a list field, cached on the instance.
+    
+    The mask is rebuilt when the list is reassigned or changes length, so
+    each lookup is O(1). In-place edits that keep the length, such as
+    replacing an element, are not detected; reassign the list after them.
+    """
+
+    def __init__(self, source: str, build: Callable[[Sequence[Any]], int]):
+        self.source = source
+        self.build = build
+
+    def __set_name__(self, owner, name):
+        # Instance slot holding (list, its length, mask)
+        self.cache = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        items = getattr(instance, self.source)
+        cached = getattr(instance, self.cache)
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            cached = (items, len(items), self.build(items))
+            setattr(instance, self.cache, cached)
+        return cached[2]
+
+
+@dataclass(slots=True)
 class Instructor:
     """Represents an instructor."""
     instructor_id: str
@@ -67,49 +126,63 @@ class Instructor:
     unavailable_slots: List[TimeSlot] = field(default_factory=list)
     max_hours_per_week: float = 40.0
     preferred_time_slots: List[TimeSlot] = field(default_factory=list)
+    _unavailable_mask: Optional[Tuple[List[TimeSlot], int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    unavailable_mask = _ListMask("unavailable_slots", _slots_mask)
+
+    def __post_init__(self):
+        self.instructor_id = _intern(self.instructor_id)
 
     def is_available(self, time_slot: TimeSlot) -> bool:
         """Check if instructor is available at given time slot."""
-        for unavailable in self.unavailable_slots:
-            if time_slot.overlaps_with(unavailable):
-                return False
-        return True
+        if not time_slot._mask:
+            # An empty slot covers no minutes, so compare its bounds directly
+            return not any(time_slot.overlaps_with(unavailable) for unavailable in self.unavailable_slots)
+        return not self.unavailable_mask & time_slot._mask
 
     def get_weekly_hours(self, schedule: 'Schedule') -> float:
         """Calculate total scheduled hours for the week."""
-        total_hours = 0.0
-        for course_schedule in schedule.get_instructor_courses(self.instructor_id):
-            total_hours += course_schedule.time_slot.duration_minutes() / 60.0
-        return total_hours
+        return schedule.get_instructor_minutes(self.instructor_id) / 60.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Classroom:
     """Represents a classroom resource."""
     room_id: str
     name: str
     capacity: int
     available_slots: List[TimeSlot] = field(default_factory=list)
-    special_equipment: Set[str] = field(default_factory=set)
+    special_equipment: FrozenSet[str] = frozenset()
+    _available_mask: Optional[Tuple[List[TimeSlot], int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    available_mask = _ListMask("available_slots", _slots_mask)
+
+    def __post_init__(self):
+        self.room_id = _intern(self.room_id)
+        if not isinstance(self.special_equipment, frozenset):
+            self.special_equipment = frozenset(self.special_equipment)
 
     def is_available(self, time_slot: TimeSlot) -> bool:
         """Check if classroom is available at given time slot."""
         if not self.available_slots:
             return True
 
-        for available in self.available_slots:
-            if time_slot.day == available.day:
-                if (time_slot.start_time >= available.start_time and 
-                    time_slot.end_time <= available.end_time):
-                    return True
-        return False
+        if not time_slot._mask:
+            # An empty slot covers no minutes, so compare its bounds directly
+            start = time_slot._start
+            return any(available._start <= start <= available._end for available in self.available_slots)
+        return time_slot._mask & self.available_mask == time_slot._mask
 
-    def has_equipment(self, required_equipment: Set[str]) -> bool:
+    def has_equipment(self, required_equipment: FrozenSet[str]) -> bool:
         """Check if classroom has required equipment."""
-        return required_equipment.issubset(self.special_equipment)
+        return required_equipment <= self.special_equipment
 
 
-@dataclass
+@dataclass(slots=True)
 class Course:
     """Represents a course to be scheduled."""
     course_id: str
@@ -118,10 +191,23 @@ class Course:
     required_capacity: int
     duration_minutes: int
     preferred_days: List[DayOfWeek] = field(default_factory=list)
-    required_equipment: Set[str] = field(default_factory=set)
+    required_equipment: FrozenSet[str] = frozenset()
     sessions_per_week: int = 1
     constraints: Dict[str, Tuple[ConstraintType, str]] = field(default_factory=dict)
 
+    _preferred_day_bits: Optional[Tuple[List[DayOfWeek], int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Bit d is set for each preferred day number d
+    preferred_day_bits = _ListMask("preferred_days", lambda days: sum({1 << day.value for day in days}))
+
+    def __post_init__(self):
+        self.course_id = _intern(self.course_id)
+        self.instructor_id = _intern(self.instructor_id)
+        if not isinstance(self.required_equipment, frozenset):
+            self.required_equipment = frozenset(self.required_equipment)
+
     def validate(self) -> Tuple[bool, List[str]]:
         """Validate course data."""
         errors = []
@@ -136,17 +222,22 @@ class Course:
         return len(errors) == 0, errors
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class CourseSchedule:
     """Represents a scheduled course."""
     course: Course
     instructor: Instructor
     classroom: Classroom
     time_slot: TimeSlot
-    scheduled_date: datetime = field(default_factory=datetime.utcnow)
+    # Set when the course is committed to a Schedule, so candidates skip the clock read
+    scheduled_date: Optional[datetime] = None
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._hash = hash((self.course.course_id, self.time_slot._hash))
 
     def __hash__(self):
-        return hash((self.course.course_id, self.time_slot))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, CourseSchedule):
@@ -155,6 +246,28 @@ class CourseSchedule:
                 self.time_slot == other.time_slot)
 
 
+# Shared result for a satisfied constraint
+_OK: Tuple[bool, Optional[str]] = (True, None)
+
+# Reported for valid entries of an atomic batch that was rejected as a whole
+_BATCH_REJECTED = "Not added because another course in the batch was rejected"
+
+
+def _hours_error(instructor: Instructor, new_total: float) -> str:
+    """Message for an instructor whose weekly hours would exceed the limit."""
+    return f"Instructor {instructor.name} would exceed max hours ({new_total} > {instructor.max_hours_per_week})"
+
+
+def _instructor_conflict_error(instructor: Instructor, time_slot: TimeSlot) -> str:
+    """Message for an instructor who is already teaching during the slot."""
+    return f"Instructor {instructor.name} has conflict at {time_slot.day.name} {time_slot.start_time}-{time_slot.end_time}"
+
+
+def _classroom_conflict_error(classroom: Classroom, time_slot: TimeSlot) -> str:
+    """Message for a classroom that is already booked during the slot."""
+    return f"Classroom {classroom.name} is double-booked at {time_slot.day.name} {time_slot.start_time}-{time_slot.end_time}"
+
+
 class ConstraintValidator:
     """Validates scheduling constraints and conflicts."""
 
@@ -166,7 +279,7 @@ class ConstraintValidator:
         """Validate instructor is available at time slot."""
         if not instructor.is_available(time_slot):
             return False, f"Instructor {instructor.name} is unavailable at {time_slot.day.name} {time_slot.start_time}-{time_slot.end_time}"
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_classroom_availability(
@@ -176,7 +289,7 @@ class ConstraintValidator:
         """Validate classroom is available at time slot."""
         if not classroom.is_available(time_slot):
             return False, f"Classroom {classroom.name} is unavailable at {time_slot.day.name} {time_slot.start_time}-{time_slot.end_time}"
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_classroom_capacity(
@@ -186,7 +299,7 @@ class ConstraintValidator:
         """Validate classroom has sufficient capacity."""
         if classroom.capacity < course.required_capacity:
             return False, f"Classroom {classroom.name} capacity ({classroom.capacity}) is less than required ({course.required_capacity})"
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_classroom_equipment(
@@ -195,9 +308,9 @@ class ConstraintValidator:
     ) -> Tuple[bool, Optional[str]]:
         """Validate classroom has required equipment."""
         if not classroom.has_equipment(course.required_equipment):
-            missing = course.required_equipment - classroom.special_equipment
+            missing = set(course.required_equipment - classroom.special_equipment)
             return False, f"Classroom {classroom.name} missing equipment: {missing}"
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_instructor_hours(
@@ -206,10 +319,11 @@ class ConstraintValidator:
         schedule: 'Schedule'
     ) -> Tuple[bool, Optional[str]]:
         """Validate instructor doesn't exceed max hours."""
-        new_total = instructor.get_weekly_hours(schedule) + course_schedule.time_slot.duration_minutes() / 60.0
+        new_total = (schedule.get_instructor_minutes(instructor.instructor_id)
+                     + course_schedule.time_slot.duration_minutes()) / 60.0
         if new_total > instructor.max_hours_per_week:
-            return False, f"Instructor {instructor.name} would exceed max hours ({new_total} > {instructor.max_hours_per_week})"
-        return True, None
+            return False, _hours_error(instructor, new_total)
+        return _OK
 
     @staticmethod
     def validate_no_instructor_conflicts(
@@ -220,8 +334,8 @@ class ConstraintValidator:
         """Validate instructor has no scheduling conflicts."""
         for course_schedule in schedule.get_instructor_courses(instructor.instructor_id):
             if time_slot.overlaps_with(course_schedule.time_slot):
-                return False, f"Instructor {instructor.name} has conflict at {time_slot.day.name} {time_slot.start_time}-{time_slot.end_time}"
-        return True, None
+                return False, _instructor_conflict_error(instructor, time_slot)
+        return _OK
 
     @staticmethod
     def validate_no_classroom_conflicts(
@@ -232,8 +346,8 @@ class ConstraintValidator:
         """Validate classroom is not double-booked."""
         for course_schedule in schedule.get_classroom_courses(classroom.room_id):
             if time_slot.overlaps_with(course_schedule.time_slot):
-                return False, f"Classroom {classroom.name} is double-booked at {time_slot.day.name} {time_slot.start_time}-{time_slot.end_time}"
-        return True, None
+                return False, _classroom_conflict_error(classroom, time_slot)
+        return _OK
 
     @staticmethod
     def validate_preferred_days(
@@ -241,9 +355,56 @@ class ConstraintValidator:
         time_slot: TimeSlot
     ) -> Tuple[bool, Optional[str]]:
         """Validate course is scheduled on preferred days if specified."""
-        if course.preferred_days and time_slot.day not in course.preferred_days:
+        preferred = course.preferred_day_bits
+        if preferred and not preferred >> time_slot._day & 1:
             return False, f"Course {course.name} scheduled on non-preferred day {time_slot.day.name}"
-        return True, None
+        return _OK
+
+
+def _overlapping_pairs(course_schedules: Iterable[CourseSchedule]) -> List[Tuple[CourseSchedule, CourseSchedule]]:
+    """Find every pair of course schedules whose time slots overlap.
+
+    Sweeps the schedules in start order, keeping only the ones still in
+    progress, so each schedule is compared against its actual overlaps
+    rather than every other schedule.
+    """
+    # Work on plain (start, end, schedule) tuples so the loop only touches ints
+    intervals = sorted(
+        ((cs.time_slot._start, cs.time_slot._end, cs) for cs in course_schedules),
+        key=itemgetter(0)
+    )
+    conflicts = []
+    active: List[Tuple[int, CourseSchedule]] = []
+    for start, end, course_schedule in intervals:
+        if active:
+            active = [entry for entry in active if entry[0] > start]
+            if end > start:
+                conflicts.extend((earlier, course_schedule) for _, earlier in active)
+            else:
+                # An empty slot only overlaps schedules that started strictly before it
+                conflicts.extend(
+                    (earlier, course_schedule) for _, earlier in active if earlier.time_slot._start < end
+                )
+        active.append((end, course_schedule))
+    return conflicts
+
+
+def _course_dict(course_schedule: CourseSchedule) -> Dict:
+    """Build the exported JSON record for one scheduled course."""
+    return {
+        "course_id": course_schedule.course.course_id,
+        "course_name": course_schedule.course.name,
+        "instructor_id": course_schedule.instructor.instructor_id,
+        "instructor_name": course_schedule.instructor.name,
+        "classroom_id": course_schedule.classroom.room_id,
+        "classroom_name": course_schedule.classroom.name,
+        "day": course_schedule.time_slot.day.name,
+        "start_time": course_schedule.time_slot.start_time.isoformat(),
+        "end_time": course_schedule.time_slot.end_time.isoformat(),
+        "duration_minutes": course_schedule.time_slot.duration_minutes(),
+        "scheduled_date": (course_schedule.scheduled_date.isoformat()
+                           if course_schedule.scheduled_date is not None else None)
+    }
 
 
 class Schedule:
@@ -252,6 +413,14 @@ class Schedule:
     def __init__(self):
         """Initialize schedule."""
         self.courses: Dict[str, CourseSchedule] = {}
+        # Scheduled courses per instructor, classroom and day number, kept in step with self.courses
+        self._by_instructor: Dict[str, List[CourseSchedule]] = {}
+        self._by_classroom: Dict[str, List[CourseSchedule]] = {}
+        self._by_day: Dict[int, List[CourseSchedule]] = {}
+        self._instructor_minutes: Dict[str, int] = {}
+        # Conflict pairs per instructor and classroom, dropped whenever their courses change
+        self._instructor_conflicts: Dict[str, List[Tuple[CourseSchedule, CourseSchedule]]] = {}
+        self._classroom_conflicts: Dict[str, List[Tuple[CourseSchedule, CourseSchedule]]] = {}
         self.validation_errors: List[str] = []
         self.validation_warnings: List[str] = []
 
@@ -277,14 +446,207 @@ class Schedule:
                 self.validation_errors.append(error_msg)
                 return False, error_msg
 
-        self.courses[course.course_id] = course_schedule
+        self._commit(course_schedule)
         return True, None
 
+    def _commit(self, course_schedule: CourseSchedule) -> None:
+        """Store a course schedule, replacing any earlier one for the same course."""
+        course_schedule.scheduled_date = datetime.utcnow()
+        course_id = course_schedule.course.course_id
+        previous = self.courses.get(course_id)
+        if previous is not None:
+            self._unindex(previous)
+        self.courses[course_id] = course_schedule
+        self._index(course_schedule)
+
+    def _index(self, course_schedule: CourseSchedule) -> None:
+        """Add a scheduled course to the instructor, classroom and day indexes."""
+        instructor_id = course_schedule.instructor.instructor_id
+        room_id = course_schedule.classroom.room_id
+        self._by_instructor.setdefault(instructor_id, []).append(course_schedule)
+        self._by_classroom.setdefault(room_id, []).append(course_schedule)
+        self._by_day.setdefault(course_schedule.time_slot._day, []).append(course_schedule)
+        self._instructor_minutes[instructor_id] = (
+            self._instructor_minutes.get(instructor_id, 0) + course_schedule.time_slot.duration_minutes()
+        )
+        self._instructor_conflicts.pop(instructor_id, None)
+        self._classroom_conflicts.pop(room_id, None)
+
+    def _unindex(self, course_schedule: CourseSchedule) -> None:
+        """Remove a scheduled course from the instructor, classroom and day indexes."""
+        for index, key in ((self._by_instructor, course_schedule.instructor.instructor_id),
+                           (self._by_classroom, course_schedule.classroom.room_id),
+                           (self._by_day, course_schedule.time_slot._day)):
+            entries = index[key]
+            entries.remove(course_schedule)
+            if not entries:
+                del index[key]
+        self._instructor_minutes[course_schedule.instructor.instructor_id] -= course_schedule.time_slot.duration_minutes()
+        self._instructor_conflicts.pop(course_schedule.instructor.instructor_id, None)
+        self._classroom_conflicts.pop(course_schedule.classroom.room_id, None)
+
+    def get_instructor_minutes(self, instructor_id: str) -> int:
+        """Get the total scheduled minutes for an instructor."""
+        return self._instructor_minutes.get(instructor_id, 0)
+
+    def add_courses(
+        self,
+        entries: Iterable[Tuple[Course, Instructor, Classroom, TimeSlot]],
+        atomic: bool = False
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Add several courses to the schedule, validating them together.
+        
+        Constraints that do not depend on other courses are checked per
+        entry. The remaining entries are then swept once in start-time
+        order against the current schedule and each other, so a batch of
+        N courses costs O(N log N) instead of N separate add_course calls.
+        When two entries in the batch clash, the one that starts first
+        is kept. As with add_course, a course already in the schedule
+        keeps blocking its current slot until its new entry is accepted.
+        Course IDs within a batch should be unique.
+        
+        Args:
+            entries: (course, instructor, classroom, time slot) per course
+            atomic: If True, add nothing unless every entry is valid
+            
+        Returns:
+            List of (success, error_message) in the order of the entries
+        """
+        entries = [CourseSchedule(*entry) for entry in entries]
+        results: List[Tuple[bool, Optional[str]]] = []
+        for course_schedule in entries:
+            results.append(self._validate_static(course_schedule))
+
+        # Existing courses whose replacement in this batch has been accepted
+        freed: Set[str] = set()
+
+        def existing(index: Dict[str, List[CourseSchedule]], key: str) -> List[CourseSchedule]:
+            return [cs for cs in index.get(key, ()) if cs.course.course_id not in freed]
+
+        minutes: Dict[str, int] = {}
+        instructor_busy: Dict[str, Tuple[int, int]] = {}
+        classroom_busy: Dict[str, Tuple[int, int]] = {}
+        order = sorted(
+            (position for position, result in enumerate(results) if result[0]),
+            key=lambda position: entries[position].time_slot._start
+        )
+        for position in order:
+            course_schedule = entries[position]
+            instructor = course_schedule.instructor
+            classroom = course_schedule.classroom
+            time_slot = course_schedule.time_slot
+            instructor_id = instructor.instructor_id
+            room_id = classroom.room_id
+
+            # Busy state is (mask of existing courses, end of the last accepted entry)
+            if instructor_id not in instructor_busy:
+                courses = existing(self._by_instructor, instructor_id)
+                minutes[instructor_id] = sum(cs.time_slot.duration_minutes() for cs in courses)
+                instructor_busy[instructor_id] = (_slots_mask(cs.time_slot for cs in courses), -1)
+            if room_id not in classroom_busy:
+                courses = existing(self._by_classroom, room_id)
+                classroom_busy[room_id] = (_slots_mask(cs.time_slot for cs in courses), -1)
+            instructor_mask, instructor_end = instructor_busy[instructor_id]
+            classroom_mask, classroom_end = classroom_busy[room_id]
+
+            new_total = (minutes[instructor_id] + time_slot.duration_minutes()) / 60.0
+            if new_total > instructor.max_hours_per_week:
+                results[position] = (False, _hours_error(instructor, new_total))
+            elif instructor_mask & time_slot._mask or instructor_end > time_slot._start:
+                results[position] = (False, _instructor_conflict_error(instructor, time_slot))
+            elif classroom_mask & time_slot._mask or classroom_end > time_slot._start:
+                results[position] = (False, _classroom_conflict_error(classroom, time_slot))
+            else:
+                minutes[instructor_id] += time_slot.duration_minutes()
+                instructor_busy[instructor_id] = (instructor_mask, max(instructor_end, time_slot._end))
+                classroom_busy[room_id] = (classroom_mask, max(classroom_end, time_slot._end))
+
+                # The accepted entry replaces the scheduled course, freeing its old slot
+                previous = self.courses.get(course_schedule.course.course_id)
+                if previous is not None and previous.course.course_id not in freed:
+                    freed.add(previous.course.course_id)
+                    previous_instructor_id = previous.instructor.instructor_id
+                    previous_room_id = previous.classroom.room_id
+                    if previous_instructor_id in instructor_busy:
+                        minutes[previous_instructor_id] -= previous.time_slot.duration_minutes()
+                        courses = existing(self._by_instructor, previous_instructor_id)
+                        instructor_busy[previous_instructor_id] = (
+                            _slots_mask(cs.time_slot for cs in courses), instructor_busy[previous_instructor_id][1]
+                        )
+                    if previous_room_id in classroom_busy:
+                        courses = existing(self._by_classroom, previous_room_id)
+                        classroom_busy[previous_room_id] = (
+                            _slots_mask(cs.time_slot for cs in courses), classroom_busy[previous_room_id][1]
+                        )
+
+        failed = False
+        for result in results:
+            if not result[0]:
+                self.validation_errors.append(result[1])
+                failed = True
+        if atomic and failed:
+            return [result if not result[0] else (False, _BATCH_REJECTED) for result in results]
+
+        for course_schedule, result in zip(entries, results):
+            if result[0]:
+                self._commit(course_schedule)
+                is_preferred, warning = ConstraintValidator.validate_preferred_days(
+                    course_schedule.course,
+                    course_schedule.time_slot
+                )
+                if not is_preferred:
+                    self.validation_warnings.append(warning)
+        return results
+
     def _validate_course_schedule(self, course_schedule: CourseSchedule) -> Tuple[bool, Optional[str]]:
         """Validate a course schedule against all constraints."""
+        is_valid, error = self._validate_static(course_schedule)
+        if not is_valid:
+            return False, error
+
+        # Validate instructor hours
+        is_valid, error = ConstraintValidator.validate_instructor_hours(
+            course_schedule.instructor,
+            course_schedule,
+            self
+        )
+        if not is_valid:
+            return False, error
+
+        # Validate no instructor conflicts
+        is_valid, error = ConstraintValidator.validate_no_instructor_conflicts(
+            course_schedule.instructor,
+            course_schedule.time_slot,
+            self
+        )
+        if not is_valid:
+            return False, error
+
+        # Validate no classroom conflicts
+        is_valid, error = ConstraintValidator.validate_no_classroom_conflicts(
+            course_schedule.classroom,
+            course_schedule.time_slot,
+            self
+        )
+        if not is_valid:
+            return False, error
+
+        # Check soft constraint: preferred days
+        is_valid, warning = ConstraintValidator.validate_preferred_days(
+            course_schedule.course,
+            course_schedule.time_slot
+        )
+        if not is_valid:
+            self.validation_warnings.append(warning)
+
+        return _OK
+
+    def _validate_static(self, course_schedule: CourseSchedule) -> Tuple[bool, Optional[str]]:
+        """Validate the constraints that do not depend on other scheduled courses."""
         # Validate course data
         is_valid, errors = course_schedule.course.validate()
-        if not errors:
+        if errors:
             return False, "; ".join(errors)
 
         # Validate instructor availability
@@ -319,84 +681,181 @@ class Schedule:
         if not is_valid:
             return False, error
 
-        # Validate instructor hours
-        is_valid, error = ConstraintValidator.validate_instructor_hours(
-            course_schedule.instructor,
-            course_schedule,
-            self
-        )
-        if not is_valid:
-            return False, error
+        return _OK
 
-        # Validate no instructor conflicts
-        is_valid, error = ConstraintValidator.validate_no_instructor_conflicts(
-            course_schedule.instructor,
-            course_schedule.time_slot,
-            self
-        )
-        if not is_valid:
-            return False, error
+    def assign_batch(
+        self,
+        requests: Sequence[Tuple[Course, Instructor, Sequence[Classroom], Sequence[TimeSlot]]]
+    ) -> Optional[Dict[str, Tuple[Classroom, TimeSlot]]]:
+        """
+        Choose a classroom and time slot for several courses and schedule them.
 
-        # Validate no classroom conflicts
-        is_valid, error = ConstraintValidator.validate_no_classroom_conflicts(
-            course_schedule.classroom,
-            course_schedule.time_slot,
-            self
-        )
-        if not is_valid:
-            return False, error
+        Runs a backtracking search with forward checking. Each course has a
+        domain of candidate (classroom, time slot) pairs held as a bitmask.
+        Assigning a course removes every clashing candidate from the
+        domains of the courses still unassigned, and the course with the
+        fewest candidates left is assigned next. Candidates on a course's
+        preferred days are tried first.
 
-        # Check soft constraint: preferred days
-        is_valid, warning = ConstraintValidator.validate_preferred_days(
-            course_schedule.course,
-            course_schedule.time_slot
-        )
-        if not is_valid:
-            self.validation_warnings.append(warning)
+        Args:
+            requests: (course, instructor, candidate classrooms, candidate
+                time slots) for each course to schedule
 
-        return True, None
+        Returns:
+            Mapping of course_id to the chosen (classroom, time slot), or
+            None if no assignment satisfies every hard constraint, in which
+            case the schedule is left unchanged
+        """
+        # Candidates that pass every check against the current schedule, plus
+        # their bits grouped by time slot as (slot mask, all bits, bits per room)
+        candidates: List[List[Tuple[Classroom, TimeSlot]]] = []
+        groups: List[List[Tuple[int, int, Dict[str, int]]]] = []
+        for course, instructor, classrooms, time_slots in requests:
+            if not course.validate()[0]:
+                return None
+            busy = _slots_mask(cs.time_slot for cs in self._by_instructor.get(instructor.instructor_id, ()))
+            rooms = [
+                (classroom, _slots_mask(cs.time_slot for cs in self._by_classroom.get(classroom.room_id, ())))
+                for classroom in classrooms
+                if classroom.capacity >= course.required_capacity
+                and classroom.has_equipment(course.required_equipment)
+            ]
+            options = []
+            for time_slot in time_slots:
+                mask = time_slot._mask
+                if not mask or busy & mask or not instructor.is_available(time_slot):
+                    continue
+                for classroom, booked in rooms:
+                    if not booked & mask and classroom.is_available(time_slot):
+                        options.append((classroom, time_slot))
+            preferred = course.preferred_day_bits
+            if preferred:
+                options.sort(key=lambda option: not preferred >> option[1]._day & 1)
+            candidates.append(options)
+
+            by_slot: Dict[int, Tuple[int, int, Dict[str, int]]] = {}
+            for k, (classroom, time_slot) in enumerate(options):
+                mask, bits, room_bits = by_slot.get(id(time_slot), (time_slot._mask, 0, {}))
+                room_bits[classroom.room_id] = room_bits.get(classroom.room_id, 0) | 1 << k
+                by_slot[id(time_slot)] = (mask, bits | 1 << k, room_bits)
+            groups.append(list(by_slot.values()))
+
+        count = len(candidates)
+        assigned = [-1] * count
+        minutes: Dict[str, int] = {}
+
+        def most_constrained(domains: List[int]) -> int:
+            best = -1
+            for j in range(count):
+                if assigned[j] < 0 and (best < 0 or domains[j].bit_count() < domains[best].bit_count()):
+                    best = j
+            return best
+
+        def forward_check(domains: List[int], i: int) -> Optional[List[int]]:
+            classroom, time_slot = candidates[i][assigned[i]]
+            instructor_id = requests[i][1].instructor_id
+            room_id = classroom.room_id
+            chosen = time_slot._mask
+            domains = list(domains)
+            for j in range(count):
+                if assigned[j] >= 0:
+                    continue
+                same_instructor = requests[j][1].instructor_id == instructor_id
+                domain = domains[j]
+                for mask, bits, room_bits in groups[j]:
+                    if mask & chosen:
+                        # Overlapping candidates clash on the instructor or on the room
+                        domain &= ~(bits if same_instructor else room_bits.get(room_id, 0))
+                if not domain:
+                    return None
+                domains[j] = domain
+            return domains
+
+        domains = [(1 << len(options)) - 1 for options in candidates]
+        # Each frame holds a course, its untried candidates and the domains before it was assigned
+        stack: List[Tuple[int, int, List[int]]] = []
+        solved = not count
+        if count:
+            first = most_constrained(domains)
+            stack.append((first, domains[first], domains))
+        while stack and not solved:
+            i, untried, saved = stack.pop()
+            instructor = requests[i][1]
+            instructor_id = instructor.instructor_id
+            if assigned[i] >= 0:
+                # Backtracking into this course, so release its previous choice
+                minutes[instructor_id] -= candidates[i][assigned[i]][1].duration_minutes()
+                assigned[i] = -1
+            while untried:
+                bit = untried & -untried
+                untried ^= bit
+                k = bit.bit_length() - 1
+                total = (minutes.get(instructor_id, self.get_instructor_minutes(instructor_id))
+                         + candidates[i][k][1].duration_minutes())
+                if total / 60.0 > instructor.max_hours_per_week:
+                    continue
+                assigned[i] = k
+                reduced = forward_check(saved, i)
+                if reduced is None:
+                    assigned[i] = -1
+                    continue
+                minutes[instructor_id] = total
+                stack.append((i, untried, saved))
+                j = most_constrained(reduced)
+                if j < 0:
+                    solved = True
+                else:
+                    stack.append((j, reduced[j], reduced))
+                break
+        if not solved:
+            return None
+
+        result: Dict[str, Tuple[Classroom, TimeSlot]] = {}
+        for (course, instructor, _, _), options, k in zip(requests, candidates, assigned):
+            classroom, time_slot = options[k]
+            # Every hard constraint was enforced during the search
+            self.add_course(course, instructor, classroom, time_slot, validate_constraints=False)
+            is_preferred, warning = ConstraintValidator.validate_preferred_days(course, time_slot)
+            if not is_preferred:
+                self.validation_warnings.append(warning)
+            result[course.course_id] = (classroom, time_slot)
+        return result
 
     def remove_course(self, course_id: str) -> bool:
         """Remove a course from the schedule."""
-        if course_id in self.courses:
-            del self.courses[course_id]
-            return True
-        return False
+        course_schedule = self.courses.pop(course_id, None)
+        if course_schedule is None:
+            return False
+        self._unindex(course_schedule)
+        return True
 
     def get_instructor_courses(self, instructor_id: str) -> List[CourseSchedule]:
         """Get all courses scheduled for an instructor."""
-        return [cs for cs in self.courses.values() 
-                if cs.instructor.instructor_id == instructor_id]
+        return list(self._by_instructor.get(instructor_id, ()))
 
     def get_classroom_courses(self, room_id: str) -> List[CourseSchedule]:
         """Get all courses scheduled for a classroom."""
-        return [cs for cs in self.courses.values() 
-                if cs.classroom.room_id == room_id]
+        return list(self._by_classroom.get(room_id, ()))
 
     def get_courses_by_day(self, day: DayOfWeek) -> List[CourseSchedule]:
         """Get all courses scheduled for a specific day."""
-        return [cs for cs in self.courses.values() 
-                if cs.time_slot.day == day]
+        return list(self._by_day.get(day.value, ()))
 
     def check_instructor_conflicts(self, instructor_id: str) -> List[Tuple[CourseSchedule, CourseSchedule]]:
         """Find all scheduling conflicts for an instructor."""
-        courses = self.get_instructor_courses(instructor_id)
-        conflicts = []
-        for i, course1 in enumerate(courses):
-            for course2 in courses[i + 1:]:
-                if course1.time_slot.overlaps_with(course2.time_slot):
-                    conflicts.append((course1, course2))
-        return conflicts
+        conflicts = self._instructor_conflicts.get(instructor_id)
+        if conflicts is None:
+            conflicts = _overlapping_pairs(self._by_instructor.get(instructor_id, ()))
+            self._instructor_conflicts[instructor_id] = conflicts
+        return list(conflicts)
 
     def check_classroom_conflicts(self, room_id: str) -> List[Tuple[CourseSchedule, CourseSchedule]]:
         """Find all double-booking conflicts for a classroom."""
-        courses = self.get_classroom_courses(room_id)
-        conflicts = []
-        for i, course1 in enumerate(courses):
-            for course2 in courses[i + 1:]:
-                if course1.time_slot.overlaps_with(course2.time_slot):
-                    conflicts.append((course1, course2))
-        return conflicts
+        conflicts = self._classroom_conflicts.get(room_id)
+        if conflicts is None:
+            conflicts = _overlapping_pairs(self._by_classroom.get(room_id, ()))
+            self._classroom_conflicts[room_id] = conflicts
+        return list(conflicts)
 
     def get_schedule_summary(self) -> Dict:
         """Generate a summary of the current schedule."""
@@ -411,26 +870,20 @@ class Schedule:
             }
         }
 
-        # Courses by day
+        # Course counts come straight from the indexes; days are listed in week order
         for day in DayOfWeek:
-            day_courses = self.get_courses_by_day(day)
+            day_courses = self._by_day.get(day.value)
             if day_courses:
                 summary["by_day"][day.name] = len(day_courses)
 
-        # Courses by instructor
-        instructors = set(cs.instructor.instructor_id for cs in self.courses.values())
-        for instructor_id in instructors:
-            courses = self.get_instructor_courses(instructor_id)
+        for instructor_id, courses in self._by_instructor.items():
             summary["by_instructor"][instructor_id] = len(courses)
 
-        # Courses by classroom
-        classrooms = set(cs.classroom.room_id for cs in self.courses.values())
-        for room_id in classrooms:
-            courses = self.get_classroom_courses(room_id)
+        for room_id, courses in self._by_classroom.items():
             summary["by_classroom"][room_id] = len(courses)
 
         # Check for conflicts
-        for instructor_id in instructors:
+        for instructor_id in self._by_instructor:
             conflicts = self.check_instructor_conflicts(instructor_id)
             if conflicts:
                 summary["conflicts"]["instructor"].append({
@@ -438,7 +891,7 @@ class Schedule:
                     "conflict_count": len(conflicts)
                 })
 
-        for room_id in classrooms:
+        for room_id in self._by_classroom:
             conflicts = self.check_classroom_conflicts(room_id)
             if conflicts:
                 summary["conflicts"]["classroom"].append({
@@ -450,24 +903,22 @@ class Schedule:
 
     def export_to_json(self) -> str:
         """Export schedule to JSON format."""
-        schedule_dict = {
-            "courses": []
-        }
+        output = StringIO()
+        self.write_json(output)
+        return output.getvalue()
+
+    def write_json(self, sink: IO[str]) -> None:
+        """Write the schedule as JSON to a text stream, one course at a time."""
+        if not self.courses:
+            sink.write('{\n  "courses": []\n}')
+            return
+        # Same layout as json.dumps(..., indent=2) on the whole document
+        separator = '{\n  "courses": [\n    '
         for course_schedule in self.courses.values():
-            schedule_dict["courses"].append({
-                "course_id": course_schedule.course.course_id,
-                "course_name": course_schedule.course.name,
-                "instructor_id": course_schedule.instructor.instructor_id,
-                "instructor_name": course_schedule.instructor.name,
-                "classroom_id": course_schedule.classroom.room_id,
-                "classroom_name": course_schedule.classroom.name,
-                "day": course_schedule.time_slot.day.name,
-                "start_time": course_schedule.time_slot.start_time.isoformat(),
-                "end_time": course_schedule.time_slot.end_time.isoformat(),
-                "duration_minutes": course_schedule.time_slot.duration_minutes(),
-                "scheduled_date": course_schedule.scheduled_date.isoformat()
-            })
-        return json.dumps(schedule_dict, indent=2)
+            sink.write(separator)
+            sink.write(json.dumps(_course_dict(course_schedule), indent=2).replace("\n", "\n    "))
+            separator = ",\n    "
+        sink.write("\n  ]\n}")
 
     def is_valid(self) -> bool:
         """Check if the schedule is valid (no hard constraint violations)."""
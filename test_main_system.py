@@ -0,0 +1,157 @@
+"""
+Tests for the course scheduling system integration.
+"""
+
+import threading
+
+from main_system import (
+    CourseLevel,
+    CourseSchedulingSystem,
+    EmailNotificationHandler,
+    Instructor,
+    NotificationHandler,
+    TimeSlot,
+)
+
+
+class FailingNotificationHandler(NotificationHandler):
+    """Handler that raises on every notification"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def notify(self, message: str, recipient: str):
+        self.calls += 1
+        raise RuntimeError("delivery failed")
+
+
+def make_system() -> CourseSchedulingSystem:
+    """Build a system with one instructor available on Monday mornings."""
+    system = CourseSchedulingSystem()
+    system.register_instructor(Instructor(
+        "i1", "Instructor", "i1@example.com", "math", [TimeSlot.from_hhmm(0, "08:00", "12:00")]
+    ))
+    return system
+
+
+def create_course(system: CourseSchedulingSystem, name: str = "Course"):
+    return system.create_course(name, "", CourseLevel.BEGINNER, system.instructors["i1"], 4, 10)
+
+
+# ============================================================================
+# Notifications
+# ============================================================================
+
+def test_notifications_are_queued_and_flushed():
+    system = make_system()
+    handler = EmailNotificationHandler()
+    system.register_notification_handler(handler)
+
+    course = create_course(system)
+    assert system.schedule_course(course.course_id)[0]
+    system.cancel_course(course.course_id, "no room")
+    system.flush_notifications()
+
+    assert [n['message'] for n in handler.sent_notifications] == [
+        "Course 'Course' has been scheduled successfully",
+        "Course 'Course' has been cancelled: no room",
+    ]
+    assert all(n['recipient'] == "i1@example.com" for n in handler.sent_notifications)
+    system.close()
+
+
+def test_close_delivers_pending_and_stops_thread():
+    system = make_system()
+    handler = EmailNotificationHandler()
+    system.register_notification_handler(handler)
+    thread = system._notify_thread
+
+    system._notify_all("before close", "someone")
+    system.close()
+
+    assert not thread.is_alive()
+    assert [n['message'] for n in handler.sent_notifications] == ["before close"]
+    system.close()
+
+
+def test_notifications_after_close_are_delivered_synchronously():
+    system = make_system()
+    handler = EmailNotificationHandler()
+    system.register_notification_handler(handler)
+    system.close()
+
+    course = create_course(system)
+    system.schedule_course(course.course_id)
+
+    flushed = threading.Thread(target=system.flush_notifications, daemon=True)
+    flushed.start()
+    flushed.join(timeout=2)
+    assert not flushed.is_alive()
+    assert len(handler.sent_notifications) == 1
+
+
+def test_failing_handler_does_not_block_others():
+    system = make_system()
+    failing = FailingNotificationHandler()
+    handler = EmailNotificationHandler()
+    system.register_notification_handler(failing)
+    system.register_notification_handler(handler)
+
+    system._notify_all("first", "someone")
+    system._notify_all("second", "someone")
+    system.flush_notifications()
+
+    assert failing.calls == 2
+    assert [n['message'] for n in handler.sent_notifications] == ["first", "second"]
+    system.close()
+
+
+# ============================================================================
+# Course listing
+# ============================================================================
+
+def test_list_courses_by_status_keeps_creation_order():
+    system = make_system()
+    first, second, third = (create_course(system, name) for name in ("A", "B", "C"))
+    system.start_course(second.course_id)
+    system.start_course(first.course_id)
+    system.start_course(third.course_id)
+
+    assert [c.name for c in system.list_courses(status=first.status)] == ["A", "B", "C"]
+
+
+def test_list_courses_while_creating():
+    system = make_system()
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        try:
+            while not done.is_set():
+                system.list_courses(level=CourseLevel.BEGINNER)
+        except Exception as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for i in range(2000):
+        create_course(system, f"Course {i}")
+    done.set()
+    thread.join()
+
+    assert not errors
+    assert len(system.list_courses(level=CourseLevel.BEGINNER)) == 2000
+
+
+def test_reschedule_notification_shows_hhmm_times():
+    system = make_system()
+    handler = EmailNotificationHandler()
+    system.register_notification_handler(handler)
+    course = create_course(system)
+    system.schedule_course(course.course_id)
+
+    assert system.reschedule_course(course.course_id, TimeSlot.from_hhmm(0, "10:00", "11:00"))[0]
+    system.close()
+    assert handler.sent_notifications[-1]['message'] == (
+        "Course 'Course' has been rescheduled from 0 08:00-09:00 to 0 10:00-11:00"
+    )
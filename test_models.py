@@ -0,0 +1,72 @@
+"""
+Tests for the scheduling data models.
+"""
+
+import pytest
+
+from models import (
+    MAX_PERIODS_PER_DAY,
+    Room,
+    SchoolClass,
+    Teacher,
+    encode_day_period,
+    parse_day_period,
+    periods_to_mask,
+)
+
+
+# ============================================================================
+# Period encoding
+# ============================================================================
+
+def test_encode_day_period():
+    assert encode_day_period(0, 0) == 0
+    assert encode_day_period(2, 3) == 2 * MAX_PERIODS_PER_DAY + 3
+
+
+@pytest.mark.parametrize("day, period", [(-1, 0), (7, 0), (0, -1), (0, MAX_PERIODS_PER_DAY)])
+def test_encode_day_period_rejects_out_of_range(day, period):
+    with pytest.raises(ValueError):
+        encode_day_period(day, period)
+
+
+def test_parse_day_period_accepts_names_and_indexes():
+    assert parse_day_period("Wednesday_3") == encode_day_period(2, 3)
+    assert parse_day_period("wednesday_3") == encode_day_period(2, 3)
+    assert parse_day_period("2_3") == encode_day_period(2, 3)
+
+
+@pytest.mark.parametrize("value", ["-1_3", "7_0", "Funday_1", "Monday_16"])
+def test_parse_day_period_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_day_period(value)
+
+
+def test_periods_to_mask():
+    mask = periods_to_mask(["Monday_0", "Friday_5"])
+    assert mask == 1 << encode_day_period(0, 0) | 1 << encode_day_period(4, 5)
+    assert periods_to_mask([]) == 0
+
+
+# ============================================================================
+# Unavailable periods
+# ============================================================================
+
+@pytest.mark.parametrize("build", [
+    lambda periods: Teacher("T1", "Teacher", unavailable_periods=periods),
+    lambda periods: SchoolClass("C1", "Class", 1, 30, unavailable_periods=periods),
+    lambda periods: Room("R1", "Room", "classroom", 30, unavailable_periods=periods),
+])
+def test_unavailable_periods_from_strings(build):
+    model = build({"Monday_3", "4_0"})
+    assert model.unavailable_periods == periods_to_mask(["Monday_3", "Friday_0"])
+    assert model.is_unavailable(0, 3)
+    assert model.is_unavailable(4, 0)
+    assert not model.is_unavailable(0, 4)
+
+
+def test_unavailable_periods_mask_is_kept():
+    mask = 1 << encode_day_period(1, 2)
+    teacher = Teacher("T1", "Teacher", unavailable_periods=mask)
+    assert teacher.unavailable_periods == mask
+    assert teacher.is_unavailable(1, 2)
@@ -0,0 +1,41 @@
+"""
+Tests for schedule report generation.
+"""
+
+from io import StringIO
+
+import pytest
+
+from reports_generator import ReportGenerator, ScheduleReportManager
+
+
+class LegacyGenerator(ReportGenerator):
+    """Subclass written against the generate()-only interface"""
+
+    def generate(self, data):
+        return f"{self.title}: {len(data)} records"
+
+
+def test_generate_only_subclass_still_works():
+    generator = LegacyGenerator("Legacy")
+    sink = StringIO()
+    generator.generate_to(sink, [{"a": 1}, {"a": 2}])
+    assert sink.getvalue() == "Legacy: 2 records"
+    assert generator.generate_columnar({"a": [1]}) == "Legacy: 1 records"
+
+
+def test_subclass_without_either_method_raises():
+    class Incomplete(ReportGenerator):
+        pass
+
+    with pytest.raises(NotImplementedError):
+        Incomplete().generate([])
+    with pytest.raises(NotImplementedError):
+        Incomplete().generate_to(StringIO(), [])
+
+
+def test_manager_uses_registered_generator():
+    manager = ScheduleReportManager()
+    manager.generators["legacy"] = LegacyGenerator()
+    assert "legacy" in manager.get_supported_formats()
+    assert manager.generate_report([{"a": 1}], "legacy", "Title") == "Title: 1 records"
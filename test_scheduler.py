@@ -0,0 +1,192 @@
+"""
+Tests for the course scheduling engine.
+"""
+
+from datetime import time
+
+from scheduler import Classroom, Course, DayOfWeek, Instructor, Schedule, TimeSlot
+
+
+def make_slot(day: DayOfWeek, start_hour: int, end_hour: int) -> TimeSlot:
+    """Build a time slot on whole hours."""
+    return TimeSlot(day, time(start_hour, 0), time(end_hour, 0))
+
+
+def make_course(course_id: str, instructor_id: str = "I1", **overrides) -> Course:
+    """Build a one-hour course that fits the default classroom."""
+    fields = dict(
+        course_id=course_id,
+        name=f"Course {course_id}",
+        instructor_id=instructor_id,
+        required_capacity=20,
+        duration_minutes=60,
+    )
+    fields.update(overrides)
+    return Course(**fields)
+
+
+def make_instructor(instructor_id: str = "I1", max_hours: float = 40.0) -> Instructor:
+    """Build an instructor with no unavailable slots."""
+    return Instructor(instructor_id, f"Instructor {instructor_id}", max_hours_per_week=max_hours)
+
+
+def make_classroom(room_id: str = "R1", capacity: int = 30) -> Classroom:
+    """Build a classroom that is always available."""
+    return Classroom(room_id, f"Room {room_id}", capacity)
+
+
+# ============================================================================
+# add_course
+# ============================================================================
+
+def test_add_course_accepts_valid_course():
+    schedule = Schedule()
+    success, error = schedule.add_course(
+        make_course("C1"), make_instructor(), make_classroom(), make_slot(DayOfWeek.MONDAY, 9, 10)
+    )
+    assert success
+    assert error is None
+    assert "C1" in schedule.courses
+    assert schedule.get_instructor_minutes("I1") == 60
+
+
+def test_add_course_rejects_instructor_clash():
+    schedule = Schedule()
+    instructor = make_instructor()
+    schedule.add_course(make_course("C1"), instructor, make_classroom("R1"), make_slot(DayOfWeek.MONDAY, 9, 10))
+
+    success, error = schedule.add_course(
+        make_course("C2"), instructor, make_classroom("R2"), make_slot(DayOfWeek.MONDAY, 9, 10)
+    )
+    assert not success
+    assert "conflict" in error
+    assert "C2" not in schedule.courses
+
+
+def test_add_course_rejects_invalid_course_data():
+    schedule = Schedule()
+    success, error = schedule.add_course(
+        make_course("C1", required_capacity=0),
+        make_instructor(),
+        make_classroom(),
+        make_slot(DayOfWeek.MONDAY, 9, 10),
+    )
+    assert not success
+    assert "capacity must be positive" in error
+    assert not schedule.courses
+
+
+def test_course_without_id_is_reported_by_validate():
+    is_valid, errors = make_course(None).validate()
+    assert not is_valid
+    assert "Course must have ID and name" in errors
+
+
+def test_non_string_ids_are_accepted():
+    assert make_instructor(1).instructor_id == 1
+    assert make_classroom(7).room_id == 7
+
+
+# ============================================================================
+# add_courses
+# ============================================================================
+
+def test_add_courses_keeps_earlier_of_clashing_entries():
+    schedule = Schedule()
+    instructor = make_instructor()
+    results = schedule.add_courses([
+        (make_course("C2"), instructor, make_classroom("R2"), make_slot(DayOfWeek.MONDAY, 9, 11)),
+        (make_course("C1"), instructor, make_classroom("R1"), make_slot(DayOfWeek.MONDAY, 8, 10)),
+        (make_course("C3"), instructor, make_classroom("R1"), make_slot(DayOfWeek.MONDAY, 10, 11)),
+    ])
+    assert [success for success, _ in results] == [False, True, True]
+    assert set(schedule.courses) == {"C1", "C3"}
+
+
+def test_add_courses_atomic_adds_nothing_on_failure():
+    schedule = Schedule()
+    classroom = make_classroom()
+    results = schedule.add_courses([
+        (make_course("C1"), make_instructor("I1"), classroom, make_slot(DayOfWeek.MONDAY, 9, 10)),
+        (make_course("C2", "I2"), make_instructor("I2"), classroom, make_slot(DayOfWeek.MONDAY, 9, 10)),
+    ], atomic=True)
+    assert not any(success for success, _ in results)
+    assert not schedule.courses
+
+
+def test_add_courses_matches_sequential_add_course_on_reschedule():
+    instructor = make_instructor()
+    classroom = make_classroom()
+
+    def fresh_schedule() -> Schedule:
+        schedule = Schedule()
+        schedule.add_course(make_course("A"), instructor, classroom, make_slot(DayOfWeek.MONDAY, 9, 10))
+        return schedule
+
+    # B takes A's slot before A has moved, so B must be rejected
+    entries = [
+        (make_course("B"), instructor, classroom, make_slot(DayOfWeek.MONDAY, 9, 10)),
+        (make_course("A"), instructor, classroom, make_slot(DayOfWeek.MONDAY, 11, 12)),
+    ]
+    batch = fresh_schedule()
+    batch_results = batch.add_courses(entries)
+    sequential = fresh_schedule()
+    sequential_results = [sequential.add_course(*entry) for entry in entries]
+
+    assert [success for success, _ in batch_results] == [success for success, _ in sequential_results]
+    assert set(batch.courses) == set(sequential.courses) == {"A"}
+    assert batch.courses["A"].time_slot == make_slot(DayOfWeek.MONDAY, 11, 12)
+
+
+# ============================================================================
+# assign_batch
+# ============================================================================
+
+def test_assign_batch_finds_assignment_without_clashes():
+    schedule = Schedule()
+    instructor = make_instructor()
+    classrooms = [make_classroom("R1")]
+    slots = [make_slot(DayOfWeek.MONDAY, 9, 10), make_slot(DayOfWeek.MONDAY, 10, 11)]
+    result = schedule.assign_batch([
+        (make_course("C1"), instructor, classrooms, slots),
+        (make_course("C2"), instructor, classrooms, slots[:1]),
+    ])
+    assert result is not None
+    assert result["C2"][1] == slots[0]
+    assert result["C1"][1] == slots[1]
+    assert schedule.is_valid()
+    assert set(schedule.courses) == {"C1", "C2"}
+
+
+def test_assign_batch_prefers_preferred_days():
+    schedule = Schedule()
+    slots = [make_slot(DayOfWeek.MONDAY, 9, 10), make_slot(DayOfWeek.FRIDAY, 9, 10)]
+    result = schedule.assign_batch([
+        (make_course("C1", preferred_days=[DayOfWeek.FRIDAY]), make_instructor(), [make_classroom()], slots),
+    ])
+    assert result["C1"][1] == slots[1]
+    assert not schedule.validation_warnings
+
+
+def test_assign_batch_returns_none_when_unsatisfiable():
+    schedule = Schedule()
+    instructor = make_instructor()
+    slots = [make_slot(DayOfWeek.MONDAY, 9, 10)]
+    result = schedule.assign_batch([
+        (make_course("C1"), instructor, [make_classroom("R1")], slots),
+        (make_course("C2"), instructor, [make_classroom("R2")], slots),
+    ])
+    assert result is None
+    assert not schedule.courses
+
+
+def test_assign_batch_respects_weekly_hours():
+    schedule = Schedule()
+    instructor = make_instructor(max_hours=1.0)
+    slots = [make_slot(DayOfWeek.MONDAY, 9, 10), make_slot(DayOfWeek.TUESDAY, 9, 10)]
+    result = schedule.assign_batch([
+        (make_course("C1"), instructor, [make_classroom()], slots),
+        (make_course("C2"), instructor, [make_classroom()], slots),
+    ])
+    assert result is None
+    assert not schedule.courses